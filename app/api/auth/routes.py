@@ -1,18 +1,24 @@
-from datetime import timedelta, timezone
+from datetime import timedelta
 from uuid import UUID, uuid4
 
 import jwt
-import pyotp
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response, status
-from fastapi.responses import JSONResponse
-from sqlmodel import select
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import false
+from sqlmodel import select, update
 
 from ...core.config import config
-from ...core.security import hash_password, verify_password
+from ...core.security import (
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
 from ...database.models.account import Account, AccountStatus, Admin, User
 from ...database.models.token import RefreshToken
 from ...database.models.volunteer import Volunteer
-from ...services.email import send_email
+from ...services.email import queue_email
+from ...services.otp import generate_otp_secret, totp_now, verify_totp
 from ...services.token import decode_token, encode_token
 from ...utils.time import get_utc_time
 from ..dependencies import CurrentAdmin, DatabaseSession, LoggedInAccount
@@ -32,6 +38,25 @@ from .schema import (
 
 router = APIRouter(prefix="/auth", tags=["Authentication Routes"])
 
+# bodies of the fixed-message responses, serialized once
+_LOGIN_SUCCESSFUL = orjson.dumps(ApiResponse(message="Login successful").model_dump())
+_ADMIN_LOGIN_SUCCESSFUL = orjson.dumps(
+    ApiResponse(message="Admin login successful").model_dump()
+)
+_LOGGED_OUT_SUCCESSFULLY = orjson.dumps(
+    ApiResponse(message="Logged out successfully").model_dump()
+)
+_TOKEN_REFRESHED_SUCCESSFULLY = orjson.dumps(
+    ApiResponse(message="Token refreshed successfully").model_dump()
+)
+_TOKEN_IS_VALID = orjson.dumps(ApiResponse(message="Token is valid").model_dump())
+
+_REFRESH_TOKEN_LIFETIME = timedelta(seconds=config.jwt_refresh_token_expiration)
+_OTP_TOKEN_LIFETIME = timedelta(seconds=config.jwt_otp_token_expiration)
+_PASSWORD_RESET_TOKEN_LIFETIME = timedelta(
+    seconds=config.jwt_password_reset_token_expiration
+)
+
 
 @router.get(
     "/me",
@@ -41,25 +66,30 @@ router = APIRouter(prefix="/auth", tags=["Authentication Routes"])
 def get_user_information(
     account: LoggedInAccount, db: DatabaseSession
 ) -> ApiResponse[LoginInformation]:
-    volunteer = db.get(Volunteer, account.uuid)
-    user = db.get(User, account.uuid)
-
-    if volunteer:
+    volunteer_name, user_name = db.exec(
+        select(Volunteer.full_name, User.full_name)
+        .select_from(Account)
+        .outerjoin(Volunteer, Volunteer.uuid == Account.uuid)
+        .outerjoin(User, User.uuid == Account.uuid)
+        .where(Account.uuid == account.uuid)
+    ).one()
+
+    if volunteer_name is not None:
         return ApiResponse(
             message="User information retrieved successfully",
             data=LoginInformation(
-                name=volunteer.full_name,
+                name=volunteer_name,
                 phone_number=account.phone_number,
                 email=account.email_address,
                 account_type="volunteer",
                 uuid=account.uuid,
             ),
         )
-    elif user:
+    elif user_name is not None:
         return ApiResponse(
             message="User information retrieved successfully",
             data=LoginInformation(
-                name=user.full_name,
+                name=user_name,
                 phone_number=account.phone_number,
                 email=account.email_address,
                 account_type="general_user",
@@ -99,8 +129,8 @@ def get_admin_information(admin: CurrentAdmin) -> ApiResponse[AdminLoginInformat
 def login(cred: LoginCredentials, db: DatabaseSession):
     account = db.scalar(
         select(Account).where(
-            Account.email_address == cred.email
-            and Account.status == AccountStatus.active
+            Account.email_address == cred.email,
+            Account.status == AccountStatus.active,
         )
     )
     if not account:
@@ -111,31 +141,31 @@ def login(cred: LoginCredentials, db: DatabaseSession):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Invalid credentials"
         )
+    if password_needs_rehash(account.password_hash):
+        account.password_hash = hash_password(cred.password)
+    now = get_utc_time()
     access_token = encode_token({"uuid": str(account.uuid), "type": "access"})
     jti = str(uuid4())
     refresh_token = encode_token(
         {"uuid": str(account.uuid), "jti": jti, "type": "refresh"},
-        expiry_timedelta=timedelta(seconds=config.jwt_refresh_token_expiration),
+        expiry_timedelta=_REFRESH_TOKEN_LIFETIME,
     )
 
     db_refresh_token = RefreshToken(
         account_uuid=account.uuid,
         refresh_token_jti=jti,
-        created_at=get_utc_time(),
-        expires_at=(
-            get_utc_time() + timedelta(seconds=config.jwt_refresh_token_expiration)
-        ),
+        created_at=now,
+        expires_at=now + _REFRESH_TOKEN_LIFETIME,
     )
     db.add(db_refresh_token)
 
-    account.last_login = get_utc_time()
-    db.add(account)
+    account.last_login = now
     db.commit()
-    db.refresh(account)
 
-    response = JSONResponse(
+    response = Response(
+        content=_LOGIN_SUCCESSFUL,
         status_code=status.HTTP_200_OK,
-        content=ApiResponse(message="Login successful").model_dump(),
+        media_type="application/json",
     )
 
     response.set_cookie(**config.access_token_cookie_options(access_token))
@@ -163,21 +193,23 @@ def admin_login(cred: LoginCredentials, db: DatabaseSession):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Invalid credentials"
         )
+    if password_needs_rehash(admin.password_hash):
+        admin.password_hash = hash_password(cred.password)
 
     access_token = encode_token({"uuid": str(admin.uuid), "type": "access"})
     jti = str(uuid4())
     refresh_token = encode_token(
         {"uuid": str(admin.uuid), "jti": jti, "type": "refresh"},
-        expiry_timedelta=timedelta(seconds=config.jwt_refresh_token_expiration),
+        expiry_timedelta=_REFRESH_TOKEN_LIFETIME,
     )
 
     admin.last_login = get_utc_time()
-    db.add(admin)
     db.commit()
 
-    response = JSONResponse(
+    response = Response(
+        content=_ADMIN_LOGIN_SUCCESSFUL,
         status_code=status.HTTP_200_OK,
-        content=ApiResponse(message="Admin login successful").model_dump(),
+        media_type="application/json",
     )
 
     response.set_cookie(**config.admin_access_token_cookie_options(access_token))
@@ -187,10 +219,11 @@ def admin_login(cred: LoginCredentials, db: DatabaseSession):
 
 
 @router.post("/logout", summary="Log out the current user", response_model=ApiResponse)
-def logout() -> JSONResponse:
-    response = JSONResponse(
+def logout() -> Response:
+    response = Response(
+        content=_LOGGED_OUT_SUCCESSFULLY,
         status_code=status.HTTP_200_OK,
-        content=ApiResponse(message="Logged out successfully").model_dump(),
+        media_type="application/json",
     )
     response.delete_cookie(config.jwt_access_key)
     response.delete_cookie(config.jwt_refresh_key)
@@ -202,7 +235,7 @@ def logout() -> JSONResponse:
     summary="Refresh a user's access token",
     response_model=ApiResponse,
 )
-def refresh_user_access_token(request: Request, db: DatabaseSession) -> JSONResponse:
+def refresh_user_access_token(request: Request, db: DatabaseSession) -> Response:
     refresh_token = request.cookies.get(config.jwt_refresh_key)
     if not refresh_token:
         raise HTTPException(
@@ -223,75 +256,51 @@ def refresh_user_access_token(request: Request, db: DatabaseSession) -> JSONResp
                 detail="Invalid refresh token payload",
             )
 
-        # Validate user exists
-        account = db.get(Account, UUID(uuid_str))
-        if not account:
-            # print("account not found")
-            raise HTTPException(
-                # just bored to send robotic messages!
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Are you sure?",
-            )
-
-        # Validate refresh token in DB
-        db_refresh_token = db.scalar(
-            select(RefreshToken).where(
-                RefreshToken.account_uuid == account.uuid,
+        # Validate and revoke the refresh token in a single statement, so the
+        # same token cannot be redeemed twice by concurrent requests
+        account_uuid = UUID(uuid_str)
+        now = get_utc_time()
+        revoked_token = db.exec(
+            update(RefreshToken)
+            .where(
+                RefreshToken.account_uuid == account_uuid,
                 RefreshToken.refresh_token_jti == jti,
+                RefreshToken.revoked == false(),
+                RefreshToken.expires_at > now,
             )
-        )
-        if not db_refresh_token:
-            # print("db refresh token not found")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Refresh token not found",
-            )
-
-        if db_refresh_token.revoked:
-            # print("refresh token revoked")
+            .values(revoked=True)
+            .returning(RefreshToken.uuid)
+        ).first()
+        if not revoked_token:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Refresh token revoked",
+                detail="Refresh token not found, revoked or expired",
             )
 
-        # Check expiry
-        now = get_utc_time()
-        if db_refresh_token.expires_at.tzinfo is None:
-            expires_at = db_refresh_token.expires_at.replace(tzinfo=timezone.utc)
-        else:
-            expires_at = db_refresh_token.expires_at
-        if expires_at < now:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, detail="Refresh token expired"
-            )
-
-        #  Revoke old token
-        db_refresh_token.revoked = True
-        db.add(db_refresh_token)
-
         #  Issue new access + refresh tokens
         new_access_token = encode_token({"uuid": uuid_str, "type": "access"})
 
         new_jti = str(uuid4())
         new_refresh_token = encode_token(
             {"uuid": uuid_str, "jti": new_jti, "type": "refresh"},
-            expiry_timedelta=timedelta(seconds=config.jwt_refresh_token_expiration),
+            expiry_timedelta=_REFRESH_TOKEN_LIFETIME,
         )
 
         new_db_token = RefreshToken(
-            account_uuid=account.uuid,
+            account_uuid=account_uuid,
             refresh_token_jti=new_jti,
             created_at=now,
-            expires_at=now + timedelta(seconds=config.jwt_refresh_token_expiration),
+            expires_at=now + _REFRESH_TOKEN_LIFETIME,
             revoked=False,
         )
         db.add(new_db_token)
         db.commit()
 
         #  Prepare response
-        response = JSONResponse(
+        response = Response(
+            content=_TOKEN_REFRESHED_SUCCESSFULLY,
             status_code=status.HTTP_200_OK,
-            content=ApiResponse(message="Token refreshed successfully").model_dump(),
+            media_type="application/json",
         )
 
         response.set_cookie(**config.access_token_cookie_options(new_access_token))
@@ -316,7 +325,7 @@ def refresh_user_access_token(request: Request, db: DatabaseSession) -> JSONResp
     summary="Refresh a admins's access token",
     response_model=ApiResponse,
 )
-def refresh_admin_access_token(request: Request, db: DatabaseSession) -> JSONResponse:
+def refresh_admin_access_token(request: Request, db: DatabaseSession) -> Response:
     refresh_token = request.cookies.get(config.jwt_admin_refresh_key)
     if not refresh_token:
         raise HTTPException(
@@ -347,9 +356,10 @@ def refresh_admin_access_token(request: Request, db: DatabaseSession) -> JSONRes
         new_access_token = encode_token({"uuid": str(admin.uuid), "type": "access"})
 
         #  Prepare response
-        response = JSONResponse(
+        response = Response(
+            content=_TOKEN_REFRESHED_SUCCESSFULLY,
             status_code=status.HTTP_200_OK,
-            content=ApiResponse(message="Token refreshed successfully").model_dump(),
+            media_type="application/json",
         )
 
         response.set_cookie(
@@ -375,7 +385,7 @@ def refresh_admin_access_token(request: Request, db: DatabaseSession) -> JSONRes
     summary="Verify the validity of an access token",
     response_model=ApiResponse,
 )
-def verify_access_token(request: Request, db: DatabaseSession) -> ApiResponse[None]:
+async def verify_access_token(request: Request) -> Response:
     access_token = request.cookies.get(config.jwt_access_key)
     if not access_token:
         raise HTTPException(
@@ -394,7 +404,7 @@ def verify_access_token(request: Request, db: DatabaseSession) -> ApiResponse[No
                 detail="Invalid access token",
             )
 
-        return ApiResponse(message="Token is valid")
+        return Response(content=_TOKEN_IS_VALID, media_type="application/json")
 
     except jwt.ExpiredSignatureError:
         raise HTTPException(
@@ -434,18 +444,21 @@ def update_user_password(
 async def send_otp_for_password_reset(
     payload: OTPSendRequest,
     db: DatabaseSession,
-    background_tasks: BackgroundTasks,
-) -> JSONResponse:
-    account = db.scalar(select(Account).where(Account.email_address == payload.email))
+) -> ORJSONResponse:
+    account = db.scalar(
+        select(Account).where(
+            Account.email_address == payload.email,
+            Account.status == AccountStatus.active,
+        )
+    )
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
         )
 
     # Generate OTP secret
-    otp_secret = pyotp.random_base32()
-    totp = pyotp.TOTP(otp_secret)
-    otp_code = totp.now()
+    otp_secret = generate_otp_secret()
+    otp_code = totp_now(otp_secret)
 
     # Encode otp_secret and account_uuid into a JWT
     otp_token_payload = {
@@ -455,15 +468,14 @@ async def send_otp_for_password_reset(
     }
     otp_jwt = encode_token(
         otp_token_payload,
-        expiry_timedelta=timedelta(seconds=config.jwt_otp_token_expiration),
+        expiry_timedelta=_OTP_TOKEN_LIFETIME,
     )
 
-    # Send OTP via email in background
+    # Queue the OTP email so the response does not wait on SMTP
     email_body = (
         f"Your OTP for password reset is: {otp_code}. It is valid for 5 minutes."
     )
-    background_tasks.add_task(
-        send_email,
+    queue_email(
         mailto=payload.email,
         subject="Password Reset OTP",
         body=email_body,
@@ -473,7 +485,7 @@ async def send_otp_for_password_reset(
     response_content = ApiResponse(
         message="OTP sent to email", data=OTPSentResponseData(otp_sent=True)
     ).model_dump()
-    json_response = JSONResponse(
+    json_response = ORJSONResponse(
         content=response_content, status_code=status.HTTP_200_OK
     )
     json_response.set_cookie(**config.otp_token_cookie_options(otp_jwt))
@@ -489,14 +501,14 @@ async def verify_otp_for_password_reset(
     payload: OTPVerifyRequest,
     request: Request,
     response: Response,
-) -> JSONResponse:
+) -> ORJSONResponse:
     otp_jwt = request.cookies.get(config.jwt_otp_key)
     if not otp_jwt:
         response_content = ApiResponse(
             message="OTP token missing or expired",
             data=OTPVerifiedResponseData(otp_verified=False),
         ).model_dump()
-        json_response = JSONResponse(
+        json_response = ORJSONResponse(
             content=response_content, status_code=status.HTTP_400_BAD_REQUEST
         )
         json_response.delete_cookie(config.jwt_otp_key)
@@ -516,16 +528,15 @@ async def verify_otp_for_password_reset(
                 message="Invalid OTP token",
                 data=OTPVerifiedResponseData(otp_verified=False),
             ).model_dump()
-            return JSONResponse(
+            return ORJSONResponse(
                 content=response_content, status_code=status.HTTP_401_UNAUTHORIZED
             )
 
-        totp = pyotp.TOTP(otp_secret)
-        if not totp.verify(str(payload.otp)):
+        if not verify_totp(otp_secret, f"{payload.otp:06d}"):
             response_content = ApiResponse(
                 message="Invalid OTP", data=OTPVerifiedResponseData(otp_verified=False)
             ).model_dump()
-            return JSONResponse(
+            return ORJSONResponse(
                 content=response_content, status_code=status.HTTP_401_UNAUTHORIZED
             )
 
@@ -535,16 +546,14 @@ async def verify_otp_for_password_reset(
                 "sub": account_uuid_str,
                 "type": "password_reset",
             },
-            expiry_timedelta=timedelta(
-                seconds=config.jwt_password_reset_token_expiration
-            ),
+            expiry_timedelta=_PASSWORD_RESET_TOKEN_LIFETIME,
         )
 
         response_content = ApiResponse(
             message="OTP verified successfully",
             data=OTPVerifiedResponseData(otp_verified=True),
         ).model_dump()
-        json_response = JSONResponse(
+        json_response = ORJSONResponse(
             content=response_content, status_code=status.HTTP_200_OK
         )
         json_response.set_cookie(
@@ -557,7 +566,7 @@ async def verify_otp_for_password_reset(
             message="Invalid or expired OTP token",
             data=OTPVerifiedResponseData(otp_verified=False),
         ).model_dump()
-        return JSONResponse(
+        return ORJSONResponse(
             content=response_content, status_code=status.HTTP_401_UNAUTHORIZED
         )
 
@@ -567,19 +576,19 @@ async def verify_otp_for_password_reset(
     summary="Reset user password",
     response_model=ApiResponse[PasswordResetResponseData],
 )
-async def reset_password(
+def reset_password(
     payload: PasswordResetRequest,
     request: Request,
     response: Response,
     db: DatabaseSession,
-) -> JSONResponse:
+) -> ORJSONResponse:
     password_reset_jwt = request.cookies.get(config.jwt_password_reset_key)
     if not password_reset_jwt:
         response_content = ApiResponse(
             message="Password reset token missing or expired",
             data=PasswordResetResponseData(message="Password reset failed."),
         ).model_dump()
-        json_response = JSONResponse(
+        json_response = ORJSONResponse(
             content=response_content, status_code=status.HTTP_400_BAD_REQUEST
         )
         json_response.delete_cookie(config.jwt_password_reset_key)
@@ -598,7 +607,7 @@ async def reset_password(
                 message="Invalid password reset token",
                 data=PasswordResetResponseData(message="Password reset failed."),
             ).model_dump()
-            return JSONResponse(
+            return ORJSONResponse(
                 content=response_content, status_code=status.HTTP_401_UNAUTHORIZED
             )
 
@@ -610,7 +619,7 @@ async def reset_password(
                 message="Account not found",
                 data=PasswordResetResponseData(message="Password reset failed."),
             ).model_dump()
-            return JSONResponse(
+            return ORJSONResponse(
                 content=response_content, status_code=status.HTTP_404_NOT_FOUND
             )
 
@@ -624,7 +633,7 @@ async def reset_password(
                 message="Password has been successfully reset."
             ),
         ).model_dump()
-        json_response = JSONResponse(
+        json_response = ORJSONResponse(
             content=response_content, status_code=status.HTTP_200_OK
         )
         return json_response
@@ -634,6 +643,6 @@ async def reset_password(
             message=f"Invalid or expired password reset token: {e}",
             data=PasswordResetResponseData(message="Password reset failed."),
         ).model_dump()
-        return JSONResponse(
+        return ORJSONResponse(
             content=response_content, status_code=status.HTTP_401_UNAUTHORIZED
         )
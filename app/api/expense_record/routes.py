@@ -1,8 +1,10 @@
 from typing import Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import select
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import delete, desc, select, update
 
 from app.api.dependencies import CurrentAdmin, DatabaseSession
 from app.api.expense_record.schema import (
@@ -12,16 +14,37 @@ from app.api.expense_record.schema import (
 )
 from app.api.global_schema import ApiResponse
 from app.database.models.payment import ExpenseRecord, PaymentRecord, PaymentType
+from app.utils.time import get_utc_time
 
 router = APIRouter(
     prefix="/expense-record", tags=["Expense Record Routes (Admin Only)"]
 )
 
+_EXPENSE_COLUMNS = frozenset(ExpenseRecord.__table__.columns.keys())  # type: ignore
+_PAYMENT_COLUMNS = frozenset(PaymentRecord.__table__.columns.keys())  # type: ignore
+
+
+def _expense_record_read(expense_record: ExpenseRecord) -> ExpenseRecordRead:
+    # fields come straight from the database, so validation is skipped
+    payment_record = expense_record.payment_record
+    return ExpenseRecordRead.model_construct(
+        amount=payment_record.amount,
+        payment_id=expense_record.payment_id,
+        transaction_id=payment_record.transaction_id,
+        payment_type=PaymentType.expense,
+        payment_time=payment_record.payment_time,
+        details=expense_record.details,
+        note=expense_record.note,
+        paid_to=expense_record.paid_to,
+        uuid=expense_record.uuid,
+        category=expense_record.category,
+    )
+
 
 @router.post("/new", response_model=ApiResponse[ExpenseRecordRead])
 def create_expense_record(
     _: CurrentAdmin, record: ExpenseRecordCreate, db: DatabaseSession
-) -> ApiResponse[ExpenseRecordRead]:
+) -> ORJSONResponse:
     payment_record = PaymentRecord(
         amount=record.amount,
         transaction_id=record.transaction_id,
@@ -41,67 +64,55 @@ def create_expense_record(
     db.add(expense_record)
     db.commit()
     db.refresh(expense_record)
-    return ApiResponse(
-        message="Expense record created successfully",
-        data=ExpenseRecordRead(
-            amount=expense_record.payment_record.amount,
-            payment_id=expense_record.payment_id,
-            transaction_id=expense_record.payment_record.transaction_id,
-            payment_type=PaymentType.expense,
-            payment_time=expense_record.payment_record.payment_time,
-            details=expense_record.details,
-            note=expense_record.note,
-            paid_to=expense_record.paid_to,
-            uuid=expense_record.uuid,
-            category=expense_record.category,
-        ),
+    return ORJSONResponse(
+        {
+            "message": "Expense record created successfully",
+            "data": _expense_record_read(expense_record).model_dump(mode="json"),
+        }
     )
 
 
 @router.get("/", response_model=ApiResponse[Sequence[ExpenseRecordRead]])
 def get_all_expense_records(
-    _: CurrentAdmin, db: DatabaseSession
-) -> ApiResponse[Sequence[ExpenseRecordRead]]:
-    expense_records = db.exec(select(ExpenseRecord)).all()[::-1]
-    return ApiResponse(
-        message="Expense records retrieved successfully",
-        data=[
-            ExpenseRecordRead(
-                amount=expense_record.payment_record.amount,
-                payment_id=expense_record.payment_id,
-                transaction_id=expense_record.payment_record.transaction_id,
-                payment_type=PaymentType.expense,
-                payment_time=expense_record.payment_record.payment_time,
-                details=expense_record.details,
-                note=expense_record.note,
-                paid_to=expense_record.paid_to,
-                uuid=expense_record.uuid,
-                category=expense_record.category,
-            )
-            for expense_record in expense_records
-        ],
+    _: CurrentAdmin,
+    db: DatabaseSession,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+) -> ORJSONResponse:
+    expense_records = db.exec(
+        select(ExpenseRecord)
+        .options(selectinload(ExpenseRecord.payment_record))  # type: ignore
+        .order_by(desc(ExpenseRecord.created_at))
+        .offset(skip)
+        .limit(limit)
+    ).all()
+    return ORJSONResponse(
+        {
+            "message": "Expense records retrieved successfully",
+            "data": [
+                _expense_record_read(expense_record).model_dump(mode="json")
+                for expense_record in expense_records
+            ],
+        }
     )
 
 
 @router.get("/{record_uuid}", response_model=ApiResponse[ExpenseRecordRead])
-def get_expense_record(_: CurrentAdmin, record_uuid: UUID, db: DatabaseSession):
-    expense_record = db.get(ExpenseRecord, record_uuid)
+def get_expense_record(
+    _: CurrentAdmin, record_uuid: UUID, db: DatabaseSession
+) -> ORJSONResponse:
+    expense_record = db.exec(
+        select(ExpenseRecord)
+        .options(joinedload(ExpenseRecord.payment_record))  # type: ignore
+        .where(ExpenseRecord.uuid == record_uuid)
+    ).first()
     if not expense_record:
         raise HTTPException(status_code=404, detail="Expense record not found")
-    return ApiResponse(
-        message="Expense record retrieved successfully",
-        data=ExpenseRecordRead(
-            amount=expense_record.payment_record.amount,
-            payment_id=expense_record.payment_id,
-            transaction_id=expense_record.payment_record.transaction_id,
-            payment_type=PaymentType.expense,
-            payment_time=expense_record.payment_record.payment_time,
-            details=expense_record.details,
-            note=expense_record.note,
-            paid_to=expense_record.paid_to,
-            uuid=expense_record.uuid,
-            category=expense_record.category,
-        ),
+    return ORJSONResponse(
+        {
+            "message": "Expense record retrieved successfully",
+            "data": _expense_record_read(expense_record).model_dump(mode="json"),
+        }
     )
 
 
@@ -111,37 +122,43 @@ def update_expense_record(
     record_uuid: UUID,
     record_data: ExpenseRecordUpdate,
     db: DatabaseSession,
-):
-    expense_record = db.get(ExpenseRecord, record_uuid)
-    if not expense_record:
-        raise HTTPException(status_code=404, detail="Expense record not found")
-
-    payment_record = expense_record.payment_record
+) -> ORJSONResponse:
     update_data = record_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        if hasattr(expense_record, key):
-            setattr(expense_record, key, value)
-        if hasattr(payment_record, key):
-            setattr(payment_record, key, value)
+    expense_fields = {
+        key: value for key, value in update_data.items() if key in _EXPENSE_COLUMNS
+    }
+    payment_fields = {
+        key: value for key, value in update_data.items() if key in _PAYMENT_COLUMNS
+    }
+
+    now = get_utc_time()
+    payment_id = db.exec(
+        update(ExpenseRecord)
+        .where(ExpenseRecord.uuid == record_uuid)
+        .values(**expense_fields, last_updated=now)
+        .returning(ExpenseRecord.payment_id)
+    ).scalar()
+    if payment_id is None:
+        raise HTTPException(status_code=404, detail="Expense record not found")
 
-    db.add(expense_record)
-    db.add(payment_record)
+    if payment_fields:
+        db.exec(
+            update(PaymentRecord)
+            .where(PaymentRecord.payment_id == payment_id)
+            .values(**payment_fields, last_updated=now)
+        )
     db.commit()
-    db.refresh(expense_record)
-    return ApiResponse(
-        message="Expense record updated successfully",
-        data=ExpenseRecordRead(
-            amount=expense_record.payment_record.amount,
-            payment_id=expense_record.payment_id,
-            transaction_id=expense_record.payment_record.transaction_id,
-            payment_type=PaymentType.expense,
-            payment_time=expense_record.payment_record.payment_time,
-            details=expense_record.details,
-            note=expense_record.note,
-            paid_to=expense_record.paid_to,
-            uuid=expense_record.uuid,
-            category=expense_record.category,
-        ),
+
+    expense_record = db.exec(
+        select(ExpenseRecord)
+        .options(joinedload(ExpenseRecord.payment_record))  # type: ignore
+        .where(ExpenseRecord.uuid == record_uuid)
+    ).one()
+    return ORJSONResponse(
+        {
+            "message": "Expense record updated successfully",
+            "data": _expense_record_read(expense_record).model_dump(mode="json"),
+        }
     )
 
 
@@ -149,16 +166,14 @@ def update_expense_record(
 def delete_expense_record_by_uuid(
     _: CurrentAdmin, record_uuid: UUID, db: DatabaseSession
 ) -> ApiResponse[None]:
-    record = db.get(ExpenseRecord, record_uuid)
-    if not record:
+    payment_id = db.exec(
+        delete(ExpenseRecord)
+        .where(ExpenseRecord.uuid == record_uuid)
+        .returning(ExpenseRecord.payment_id)
+    ).scalar()
+    if payment_id is None:
         raise HTTPException(status_code=404, detail="Expense record not found")
 
-    payment_record = db.exec(
-        select(PaymentRecord).where(PaymentRecord.payment_id == record.payment_id)
-    ).first()
-    if payment_record:
-        db.delete(payment_record)
-
-    db.delete(record)
+    db.exec(delete(PaymentRecord).where(PaymentRecord.payment_id == payment_id))
     db.commit()
     return ApiResponse(message="Expense record deleted successfully")
@@ -1,40 +1,61 @@
+import asyncio
 import io
-from typing import IO
+import os
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 
-from cryptography.fernet import Fernet
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
 from PIL import Image
 
 from ...core.config import config
 from ...database.models.issue import LostAndFoundIssue
 from ...database.models.volunteer import Volunteer
+from ...services.nid import encrypt_nid_image
 from ..dependencies import DatabaseSession
 from ..global_schema import ApiResponse
+from ..image.routes import invalidate_cached_lost_and_found_images
 from .schema import FileUploadData
 
 router = APIRouter(prefix="/file-upload", tags=["File Upload"])
-nid_fernet = Fernet(config.nid_encryption_key)
+# Pillow releases the GIL while decoding, resampling and encoding, so image
+# work runs in parallel threads without blocking the event loop
+image_processing_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="image-processing"
+)
+
+# leading bytes of the formats accepted for upload; WEBP is checked separately
+# because its RIFF header carries the file size before the format tag
+_IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"GIF87a",
+    b"GIF89a",
+    b"BM",  # BMP
+    b"II*\x00",  # TIFF, little endian
+    b"MM\x00*",  # TIFF, big endian
+)
+
+
+def _has_image_signature(image_data: bytes) -> bool:
+    return image_data.startswith(_IMAGE_SIGNATURES) or (
+        image_data[:4] == b"RIFF" and image_data[8:12] == b"WEBP"
+    )
 
 
 def _process_img(
-    image_file: IO[bytes],
+    image_data: bytes,
     max_allowed_dimension: int = 1000,
 ) -> io.BytesIO:
     try:
-        img = Image.open(image_file)
-        original_width, original_height = img.size
-
-        # Only resize if the longest side > 1000px
-        if max(original_width, original_height) > max_allowed_dimension:
-            if original_width > original_height:
-                new_width = max_allowed_dimension
-                new_height = int(original_height * (new_width / original_width))
-            else:
-                new_height = max_allowed_dimension
-                new_width = int(original_width * (new_height / original_height))
+        img = Image.open(io.BytesIO(image_data))
+        target_size = (max_allowed_dimension, max_allowed_dimension)
 
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)  # type: ignore
+        # Only resize if the longest side > max_allowed_dimension. draft() lets
+        # the JPEG decoder downscale while decoding, and reducing_gap shrinks
+        # by an integer factor before the final LANCZOS pass, so the full
+        # resolution pixel buffer is never resampled
+        img.draft(None, target_size)  # type: ignore
+        img.thumbnail(target_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
 
         img_buffer = io.BytesIO()
         img.save(img_buffer, "WEBP", quality=75)  # Save with high quality
@@ -44,8 +65,24 @@ def _process_img(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid image data: {e}"
         )
-    finally:
-        image_file.close()
+
+
+async def _process_img_async(
+    image: UploadFile,
+    max_allowed_dimension: int = 1000,
+) -> io.BytesIO:
+    # UploadFile.read() moves to a thread once the upload has spooled to disk
+    image_data = await image.read()
+    if not _has_image_signature(image_data):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid image data: unsupported image format",
+        )
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        image_processing_pool, _process_img, image_data, max_allowed_dimension
+    )
 
 
 @router.post("/volunteer/nid", response_model=ApiResponse[FileUploadData])
@@ -61,13 +98,16 @@ async def upload_nid_images(
             status_code=status.HTTP_404_NOT_FOUND, detail="Volunteer not found"
         )
 
+    nid_1_img_data, nid_2_img_data = await asyncio.gather(
+        _process_img_async(nid_first_img, 1000),
+        _process_img_async(nid_second_img, 1000),
+    )
+
     nid_first_img_path = config.construct_nid_first_image_path(volunteer_uuid)
-    nid_1_img_data = _process_img(nid_first_img.file, 1000)
-    encrypted_nid_1_img_data = nid_fernet.encrypt(nid_1_img_data.getvalue())
+    encrypted_nid_1_img_data = encrypt_nid_image(nid_1_img_data.getvalue())
 
     nid_second_img_path = config.construct_nid_second_image_path(volunteer_uuid)
-    nid_2_img_data = _process_img(nid_second_img.file, 1000)
-    nid_2_encrypted_img_data = nid_fernet.encrypt(nid_2_img_data.getvalue())
+    nid_2_encrypted_img_data = encrypt_nid_image(nid_2_img_data.getvalue())
 
     with open(nid_first_img_path, "wb") as nid_1_img_file:
         nid_1_img_file.write(encrypted_nid_1_img_data)
@@ -93,7 +133,7 @@ async def upload_profile_pic(
         )
 
     profile_pic_path = config.construct_profile_pic_path(volunteer_uuid)
-    profile_img_data = _process_img(profile_pic.file, 376)
+    profile_img_data = await _process_img_async(profile_pic, 376)
 
     with open(profile_pic_path, "wb") as profile_pic_file:
         profile_pic_file.write(profile_img_data.getvalue())
@@ -123,11 +163,14 @@ async def upload_lost_and_found_images(
             detail="Lost and Found Issue not found",
         )
 
-    for i, image in enumerate(images):
+    images_data = await asyncio.gather(
+        *(_process_img_async(image, 1000) for image in images)
+    )
+    for i, img_data in enumerate(images_data):
         image_path = config.construct_lost_and_found_image_path(issue_uuid, i + 1)
-        img_data = _process_img(image.file, 1000)
         with open(image_path, "wb") as img_file:
             img_file.write(img_data.getvalue())
+    invalidate_cached_lost_and_found_images(issue_uuid)
 
     return ApiResponse(
         message="Lost and Found issue images uploaded successfully",
@@ -1,81 +1,151 @@
 import os
+from email.utils import formatdate
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
 from uuid import UUID
 
-from cryptography.fernet import Fernet
-from fastapi import APIRouter, HTTPException, status
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import Path as PathParam
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, Response
 
 from ...core.config import config
+from ...services.nid import decrypt_nid_image
 from ..dependencies import CurrentAdmin
 from ..global_schema import ApiResponse
 
 router = APIRouter(prefix="/image", tags=["Image Delivery"])
-nid_fernet = Fernet(config.nid_encryption_key)
 
+# images are overwritten in place on re-upload, so clients must revalidate;
+# an unchanged image costs a header-only 304
+_PUBLIC_IMAGE_CACHE_CONTROL = "public, no-cache"
+# NID images are only shown to admins; keep them out of shared caches
+_NID_IMAGE_CACHE_CONTROL = "private, max-age=300, must-revalidate"
 
-@router.get("/volunteer/{uuid}/profile-pic")
-async def get_profile_pic(uuid: UUID):
-    file_path = config.construct_profile_pic_path(uuid)
-    if not os.path.exists(file_path):
+# image URLs of lost-and-found issues that have images. Issues without images
+# are not cached, so a first upload handled by another worker shows up at once
+_lost_and_found_image_urls_cache: TTLCache[UUID, list[str]] = TTLCache(
+    maxsize=10_000, ttl=60
+)
+_lost_and_found_image_urls_cache_lock = Lock()
+
+
+def invalidate_cached_lost_and_found_images(issue_uuid: UUID) -> None:
+    with _lost_and_found_image_urls_cache_lock:
+        _lost_and_found_image_urls_cache.pop(issue_uuid, None)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    return any(
+        tag.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for tag in if_none_match.split(",")
+    )
+
+
+def _stat_etag(stat_result: os.stat_result) -> str:
+    return f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+# NID images only change on upload, which also bumps mtime_ns, so a stale entry
+# is never served; the bound caps the memory held by decrypted images
+@lru_cache(maxsize=256)
+def _decrypt_nid_image_file(file_path: Path, mtime_ns: int) -> bytes:
+    with open(file_path, "rb") as f:
+        return decrypt_nid_image(f.read())
+
+
+# filesystem calls run in the threadpool so a slow disk does not stall the
+# event loop
+async def _serve_image(
+    request: Request, file_path: Path, *, encrypted: bool = False
+) -> Response:
+    try:
+        stat_result = await run_in_threadpool(os.stat, file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
         )
-    return FileResponse(file_path, media_type="image/webp")
+
+    # for NID images the stat of the encrypted file identifies the image too
+    etag = _stat_etag(stat_result)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": (
+            _NID_IMAGE_CACHE_CONTROL if encrypted else _PUBLIC_IMAGE_CACHE_CONTROL
+        ),
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if encrypted:
+        return Response(
+            content=await run_in_threadpool(
+                _decrypt_nid_image_file, file_path, stat_result.st_mtime_ns
+            ),
+            media_type="image/webp",
+            headers=headers,
+        )
+    if config.image_accel_redirect_prefix:
+        relative_path = file_path.relative_to(config.upload_dir).as_posix()
+        headers["X-Accel-Redirect"] = (
+            f"{config.image_accel_redirect_prefix.rstrip('/')}/{relative_path}"
+        )
+        return Response(media_type="image/webp", headers=headers)
+    if config.image_x_sendfile:
+        headers["X-Sendfile"] = str(file_path)
+        return Response(media_type="image/webp", headers=headers)
+    return FileResponse(
+        file_path, media_type="image/webp", headers=headers, stat_result=stat_result
+    )
+
+
+@router.get("/volunteer/{uuid}/profile-pic")
+async def get_profile_pic(uuid: UUID, request: Request):
+    file_path = config.construct_profile_pic_path(uuid)
+    return await _serve_image(request, file_path)
 
 
 @router.get("/volunteer/{uuid}/nid-1")
-async def get_nid_1(uuid: UUID, _: CurrentAdmin):
+async def get_nid_1(uuid: UUID, _: CurrentAdmin, request: Request):
     file_path = config.construct_nid_first_image_path(uuid)
-    if not os.path.exists(file_path):
-        if not os.path.exists(str(file_path).replace(".encrypted", ".webp")):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
-            )
-        else:
-            # encrypted if unencrypted
-            with open(str(file_path).replace(".encrypted", ".webp"), "rb") as f:
-                encrypted_image_data = nid_fernet.encrypt(f.read())
-                with open(file_path, "wb") as f:
-                    f.write(encrypted_image_data)
-
-    with open(file_path, "rb") as f:
-        decrypted_img_data = nid_fernet.decrypt(f.read())
-    return Response(content=decrypted_img_data, media_type="image/webp")
+    return await _serve_image(request, file_path, encrypted=True)
 
 
 @router.get("/volunteer/{uuid}/nid-2")
-async def get_nid_2(uuid: UUID, _: CurrentAdmin):
+async def get_nid_2(uuid: UUID, _: CurrentAdmin, request: Request):
     file_path = config.construct_nid_second_image_path(uuid)
-    if not os.path.exists(file_path):
-        if not os.path.exists(str(file_path).replace(".encrypted", ".webp")):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
-            )
-        else:
-            # encrypted if unencrypted
-            with open(str(file_path).replace(".encrypted", ".webp"), "rb") as f:
-                encrypted_image_data = nid_fernet.encrypt(f.read())
-                with open(file_path, "wb") as f:
-                    f.write(encrypted_image_data)
-
-    with open(file_path, "rb") as f:
-        decrypted_img_data = nid_fernet.decrypt(f.read())
-    return Response(content=decrypted_img_data, media_type="image/webp")
+    return await _serve_image(request, file_path, encrypted=True)
 
 
 @router.get("/issue/lost-and-found/{issue_uuid}/image-{image_number}")
-async def get_lost_and_found_image(issue_uuid: UUID, image_number: int):
-    if not 1 <= image_number <= 3:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Image number must be between 1 and 3",
-        )
+async def get_lost_and_found_image(
+    issue_uuid: UUID,
+    request: Request,
+    image_number: int = PathParam(..., ge=1, le=3),
+):
     file_path = config.construct_lost_and_found_image_path(issue_uuid, image_number)
-    if not os.path.exists(file_path):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
-        )
-    return FileResponse(file_path, media_type="image/webp")
+    return await _serve_image(request, file_path)
+
+
+def _find_lost_and_found_image_urls(issue_uuid: UUID) -> list[str]:
+    image_urls: list[str] = []
+    url_prefix = f"/image/issue/lost-and-found/{issue_uuid}/image-"
+    # uploads are numbered 1..n without gaps, so the first missing image
+    # ends the probe; an issue without images costs one stat, not three
+    for i in range(1, 4):
+        file_path = config.construct_lost_and_found_image_path(issue_uuid, i)
+        if not os.path.exists(file_path):
+            break
+        image_urls.append(f"{url_prefix}{i}")
+    return image_urls
 
 
 @router.get(
@@ -83,21 +153,22 @@ async def get_lost_and_found_image(issue_uuid: UUID, image_number: int):
     response_model=ApiResponse[list[str]],
 )
 async def get_lost_and_found_images_list(issue_uuid: UUID):
-    image_urls: list[str] = []
-    found_images_count = 0
-    for i in range(1, 4):  # Check for images 1 to 3
-        file_path = config.construct_lost_and_found_image_path(issue_uuid, i)
-        if os.path.exists(file_path):
-            image_urls.append(f"/image/issue/lost-and-found/{issue_uuid}/image-{i}")
-            found_images_count += 1
+    with _lost_and_found_image_urls_cache_lock:
+        image_urls = _lost_and_found_image_urls_cache.get(issue_uuid)
 
-    if not image_urls:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No images found for this issue",
+    if image_urls is None:
+        image_urls = await run_in_threadpool(
+            _find_lost_and_found_image_urls, issue_uuid
         )
+        if not image_urls:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No images found for this issue",
+            )
+        with _lost_and_found_image_urls_cache_lock:
+            _lost_and_found_image_urls_cache[issue_uuid] = image_urls
 
     return ApiResponse(
-        message=f"Fetched successfully, found {found_images_count} images",
+        message=f"Fetched successfully, found {len(image_urls)} images",
         data=image_urls,
     )
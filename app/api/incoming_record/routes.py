@@ -1,23 +1,50 @@
-from typing import Sequence
+from itertools import chain
+from typing import Iterator, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import select
+import orjson
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import RowMapping
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, desc, select
 
 from app.api.dependencies import CurrentAdmin, DatabaseSession
 from app.api.global_schema import ApiResponse
 from app.api.incoming_record.schema import (
     IncomingRecordCreate,
+    IncomingRecordPage,
     IncomingRecordRead,
     IncomingRecordUpdate,
 )
 
+from ...database.engine import emr_engine
 from ...database.models.payment import IncomingRecord, PaymentRecord, PaymentType
 
 router = APIRouter(
     prefix="/incoming-record", tags=["Incoming Record Routes (Admin Only)"]
 )
 
+_INCOMING_COLUMNS = frozenset(IncomingRecord.__table__.columns.keys())  # type: ignore
+_PAYMENT_COLUMNS = frozenset(PaymentRecord.__table__.columns.keys())  # type: ignore
+
+
+def _incoming_record_read(incoming_record: IncomingRecord) -> IncomingRecordRead:
+    # fields come straight from the database, so validation is skipped
+    payment_record = incoming_record.payment_record
+    return IncomingRecordRead.model_construct(
+        amount=payment_record.amount,
+        payment_id=incoming_record.payment_id,
+        transaction_id=payment_record.transaction_id,
+        payment_type=PaymentType.incoming,
+        payment_time=payment_record.payment_time,
+        details=incoming_record.details,
+        note=incoming_record.note,
+        source=incoming_record.source,
+        paid_by=incoming_record.paid_by,
+        uuid=incoming_record.uuid,
+    )
+
 
 @router.post("/new", response_model=ApiResponse[IncomingRecordRead])
 def create_incoming_record(
@@ -29,82 +56,106 @@ def create_incoming_record(
         payment_type=PaymentType.incoming,
         payment_time=record.payment_time,
     )
-    db.add(payment_record)
-    db.flush()
-
+    # payment_id is a snowflake generated client-side, so no flush is needed
+    # before the incoming record can reference it
     incoming_record = IncomingRecord(
         payment_id=payment_record.payment_id,
         details=record.details,
         source=record.source,
         paid_by=record.paid_by,
         note=record.note,
+        payment_record=payment_record,
     )
-    db.add(incoming_record)
+    db.add_all([payment_record, incoming_record])
     db.commit()
-    db.refresh(incoming_record)
     return ApiResponse(
         message="Incoming record created successfully",
-        data=IncomingRecordRead(
-            amount=incoming_record.payment_record.amount,
-            payment_id=incoming_record.payment_id,
-            transaction_id=incoming_record.payment_record.transaction_id,
-            payment_type=PaymentType.incoming,
-            payment_time=incoming_record.payment_record.payment_time,
-            details=incoming_record.details,
-            note=incoming_record.note,
-            source=incoming_record.source,
-            paid_by=incoming_record.paid_by,
-            uuid=incoming_record.uuid,
-        ),
+        data=_incoming_record_read(incoming_record),
     )
 
 
-@router.get("/", response_model=ApiResponse[Sequence[IncomingRecordRead]])
+_INCOMING_RECORD_LIST_COLUMNS = (
+    IncomingRecord.uuid,
+    IncomingRecord.payment_id,
+    IncomingRecord.details,
+    IncomingRecord.note,
+    IncomingRecord.source,
+    IncomingRecord.paid_by,
+    PaymentRecord.amount,
+    PaymentRecord.transaction_id,
+    PaymentRecord.payment_type,
+    PaymentRecord.payment_time,
+)
+
+
+_INCOMING_RECORD_LIST_BATCH_SIZE = 100
+
+
+def _dump_incoming_record_rows(batch: Sequence[RowMapping]) -> bytes:
+    # plain rows encoded by orjson; OPT_UTC_Z keeps pydantic's "Z" suffix
+    return b",".join(orjson.dumps(dict(row), option=orjson.OPT_UTC_Z) for row in batch)
+
+
+def _stream_incoming_records(limit: int, cursor: int | None) -> Iterator[bytes]:
+    # the request's session is closed before a streamed body is sent, so the
+    # generator opens its own and reads the rows in batches
+    with Session(emr_engine) as db:
+        # payment ids are snowflakes, so descending ids list the newest records
+        # first and the last id seen is a unique keyset cursor
+        query = (
+            select(*_INCOMING_RECORD_LIST_COLUMNS)
+            .join(PaymentRecord, IncomingRecord.payment_id == PaymentRecord.payment_id)  # type: ignore
+            .order_by(desc(IncomingRecord.payment_id))
+            .limit(limit)
+            .execution_options(yield_per=_INCOMING_RECORD_LIST_BATCH_SIZE)
+        )
+        if cursor is not None:
+            query = query.where(IncomingRecord.payment_id < cursor)
+        batches = db.exec(query).mappings().partitions()
+
+        # nothing is yielded before the first batch is read, so the route can
+        # still turn a failing query into an error response
+        batch = next(batches, [])
+        yield (
+            b'{"message":"Incoming records retrieved successfully","data":['
+            + _dump_incoming_record_rows(batch)
+        )
+        count = len(batch)
+        last_payment_id = batch[-1]["payment_id"] if batch else None
+        for batch in batches:
+            yield b"," + _dump_incoming_record_rows(batch)
+            count += len(batch)
+            last_payment_id = batch[-1]["payment_id"]
+        next_cursor = last_payment_id if count == limit else None
+        yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+
+@router.get("/", response_model=IncomingRecordPage)
 def get_all_incoming_records(
-    _: CurrentAdmin, db: DatabaseSession
-) -> ApiResponse[list[IncomingRecordRead]]:
-    incoming_records = db.exec(select(IncomingRecord)).all()[::-1]
-    return ApiResponse(
-        message="Incoming records retrieved successfully",
-        data=[
-            IncomingRecordRead(
-                amount=incoming_record.payment_record.amount,
-                payment_id=incoming_record.payment_id,
-                transaction_id=incoming_record.payment_record.transaction_id,
-                payment_type=PaymentType.incoming,
-                payment_time=incoming_record.payment_record.payment_time,
-                details=incoming_record.details,
-                note=incoming_record.note,
-                source=incoming_record.source,
-                paid_by=incoming_record.paid_by,
-                uuid=incoming_record.uuid,
-            )
-            for incoming_record in incoming_records
-        ],
-    )
+    _: CurrentAdmin,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: int | None = Query(None, description="`next_cursor` of the previous page"),
+) -> StreamingResponse:
+    stream = _stream_incoming_records(limit, cursor)
+    # run the query before the 200 status is sent
+    head = next(stream)
+    return StreamingResponse(chain((head,), stream), media_type="application/json")
 
 
 @router.get("/{record_uuid}", response_model=ApiResponse[IncomingRecordRead])
 def get_incoming_record(
     _: CurrentAdmin, record_uuid: UUID, db: DatabaseSession
 ) -> ApiResponse[IncomingRecordRead]:
-    incoming_record = db.get(IncomingRecord, record_uuid)
+    incoming_record = db.exec(
+        select(IncomingRecord)
+        .options(joinedload(IncomingRecord.payment_record))  # type: ignore
+        .where(IncomingRecord.uuid == record_uuid)
+    ).first()
     if not incoming_record:
         raise HTTPException(status_code=404, detail="Incoming record not found")
     return ApiResponse(
         message="Incoming record retrieved successfully",
-        data=IncomingRecordRead(
-            amount=incoming_record.payment_record.amount,
-            payment_id=incoming_record.payment_id,
-            transaction_id=incoming_record.payment_record.transaction_id,
-            payment_type=PaymentType.incoming,
-            payment_time=incoming_record.payment_record.payment_time,
-            details=incoming_record.details,
-            note=incoming_record.note,
-            source=incoming_record.source,
-            paid_by=incoming_record.paid_by,
-            uuid=incoming_record.uuid,
-        ),
+        data=_incoming_record_read(incoming_record),
     )
 
 
@@ -115,43 +166,31 @@ def update_incoming_record(
     record_data: IncomingRecordUpdate,
     db: DatabaseSession,
 ) -> ApiResponse[IncomingRecordRead]:
-    incoming_record = db.get(IncomingRecord, record_uuid)
+    incoming_record = db.exec(
+        select(IncomingRecord)
+        .options(joinedload(IncomingRecord.payment_record))  # type: ignore
+        .where(IncomingRecord.uuid == record_uuid)
+    ).first()
     if not incoming_record:
         raise HTTPException(status_code=404, detail="Incoming record not found")
 
-    payment_record = db.exec(
-        select(PaymentRecord).where(
-            PaymentRecord.payment_id == incoming_record.payment_id
-        )
-    ).first()
+    payment_record = incoming_record.payment_record
     if not payment_record:
         raise HTTPException(status_code=404, detail="Payment record not found")
 
     update_data = record_data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
-        if hasattr(incoming_record, key):
-            setattr(incoming_record, key, value)
-        if hasattr(payment_record, key):
+        if key in _PAYMENT_COLUMNS:
             setattr(payment_record, key, value)
+        elif key in _INCOMING_COLUMNS:
+            setattr(incoming_record, key, value)
 
     db.add(incoming_record)
     db.add(payment_record)
     db.commit()
-    db.refresh(incoming_record)
     return ApiResponse(
         message="Incoming record updated successfully",
-        data=IncomingRecordRead(
-            amount=incoming_record.payment_record.amount,
-            payment_id=incoming_record.payment_id,
-            transaction_id=incoming_record.payment_record.transaction_id,
-            payment_type=PaymentType.incoming,
-            payment_time=incoming_record.payment_record.payment_time,
-            details=incoming_record.details,
-            note=incoming_record.note,
-            source=incoming_record.source,
-            paid_by=incoming_record.paid_by,
-            uuid=incoming_record.uuid,
-        ),
+        data=_incoming_record_read(incoming_record),
     )
 
 
@@ -159,15 +198,16 @@ def update_incoming_record(
 def delete_incoming_record(
     _: CurrentAdmin, record_uuid: UUID, db: DatabaseSession
 ) -> ApiResponse[None]:
-    record = db.get(IncomingRecord, record_uuid)
+    record = db.exec(
+        select(IncomingRecord)
+        .options(joinedload(IncomingRecord.payment_record))  # type: ignore
+        .where(IncomingRecord.uuid == record_uuid)
+    ).first()
     if not record:
         raise HTTPException(status_code=404, detail="Incoming record not found")
 
-    payment_record = db.exec(
-        select(PaymentRecord).where(PaymentRecord.payment_id == record.payment_id)
-    ).first()
-    if payment_record:
-        db.delete(payment_record)
+    if record.payment_record:
+        db.delete(record.payment_record)
 
     db.delete(record)
     db.commit()
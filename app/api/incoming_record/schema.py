@@ -4,6 +4,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from ...database.models.payment import IncomingRecordSource, PaymentType
+from ..global_schema import ApiResponse
 
 
 class IncomingRecordBase(BaseModel):
@@ -26,6 +27,10 @@ class IncomingRecordRead(IncomingRecordBase):
     payment_id: int
 
 
+class IncomingRecordPage(ApiResponse[list[IncomingRecordRead]]):
+    next_cursor: int | None = None
+
+
 class IncomingRecordUpdate(BaseModel):
     amount: int | None = None
     transaction_id: str | None = None
@@ -1,7 +1,12 @@
-from uuid import UUID
+from threading import Lock
+from typing import Any
+from uuid import UUID, uuid4
 
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlmodel import Session, and_, func, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlmodel import Session, and_, desc, func, literal, or_, select, tuple_
 
 from ...core.config import config
 from ...core.security import hash_password
@@ -16,8 +21,9 @@ from ...database.models.issue import (
     VolunteerIssueResponse,
 )
 from ...database.models.volunteer import Volunteer, VolunteerStatus
-from ...services.email import send_email
+from ...services.email import queue_bulk_email, queue_email
 from ...utils.password import generate_random_password
+from ...utils.time import get_utc_time
 from ..dependencies import (
     CurrentAdmin,
     CurrentVolunteer,
@@ -25,6 +31,7 @@ from ..dependencies import (
     RequestingActor,
 )
 from ..global_schema import ApiResponse
+from ..pagination import decode_keyset_cursor, encode_keyset_cursor
 from .schema import (
     BloodDonationIssueCreate,
     BloodDonationIssueRead,
@@ -40,6 +47,40 @@ from .schema import (
 
 router = APIRouter(prefix="/issues", tags=["Issues Management Routes"])
 
+# in dev mode a lazy load that an issue query did not plan for raises instead
+# of silently issuing another SELECT
+_LAZY_LOAD_GUARD = (raiseload("*"),) if config.dev_mode else ()
+# volunteer fan-out queries stream their rows in batches of this size
+_VOLUNTEER_FAN_OUT_BATCH_SIZE = 100
+
+# response data of the public issue reads, keyed by endpoint and arguments.
+# Writes handled by this worker invalidate their entries; other workers see
+# them once the entry expires
+_issue_details_cache: TTLCache[tuple[str, UUID], Any] = TTLCache(maxsize=10_000, ttl=10)
+_issue_list_cache: TTLCache[tuple[str | None, int], GetIssuesData] = TTLCache(
+    maxsize=1_000, ttl=10
+)
+_issue_cache_lock = Lock()
+
+
+def invalidate_cached_issue(uuid: UUID | None = None) -> None:
+    # every list page may contain the issue, so the whole list cache goes
+    with _issue_cache_lock:
+        if uuid is not None:
+            for endpoint in ("issue", "blood_donation", "lost_and_found"):
+                _issue_details_cache.pop((endpoint, uuid), None)
+        _issue_list_cache.clear()
+
+
+def _get_cached_issue_details(endpoint: str, uuid: UUID) -> Any:
+    with _issue_cache_lock:
+        return _issue_details_cache.get((endpoint, uuid))
+
+
+def _cache_issue_details(endpoint: str, uuid: UUID, data: Any) -> None:
+    with _issue_cache_lock:
+        _issue_details_cache[(endpoint, uuid)] = data
+
 
 @router.get(
     "/",
@@ -47,21 +88,40 @@ router = APIRouter(prefix="/issues", tags=["Issues Management Routes"])
     response_model=ApiResponse[GetIssuesData],
 )
 def get_all_issues(
-    db: DatabaseSession, skip: int = 0, limit: int = 100
+    db: DatabaseSession,
+    after: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
 ) -> ApiResponse[GetIssuesData]:
-    # Fetch paginated issues
-    issues = db.exec(select(Issue).offset(skip).limit(limit)).all()
-
-    # Count total issues
-    total_issues = db.exec(select(func.count()).select_from(Issue)).one()
-
-    return ApiResponse(
-        message="Issues retrieved successfully",
-        data=GetIssuesData(
-            issues=issues,
-            has_more=((skip + len(issues)) < total_issues),
-        ),
+    with _issue_cache_lock:
+        data = _issue_list_cache.get((after, limit))
+    if data is not None:
+        return ApiResponse(message="Issues retrieved successfully", data=data)
+
+    # keyset pagination, newest first; one extra row tells whether more exist
+    query = (
+        select(Issue)
+        .order_by(desc(Issue.created_at), desc(Issue.uuid))
+        .limit(limit + 1)
     )
+    if after:
+        query = query.where(
+            tuple_(Issue.created_at, Issue.uuid) < decode_keyset_cursor(after)
+        )
+    issues = db.exec(query).all()
+
+    has_more = len(issues) > limit
+    # cached across requests, so the rows are copied off the closing session
+    issues = [Issue.model_validate(issue) for issue in issues[:limit]]
+    last = issues[-1] if has_more else None
+    next_cursor = encode_keyset_cursor(last.created_at, last.uuid) if last else None
+    data = GetIssuesData(
+        issues=issues,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
+    with _issue_cache_lock:
+        _issue_list_cache[(after, limit)] = data
+    return ApiResponse(message="Issues retrieved successfully", data=data)
 
 
 @router.get(
@@ -70,12 +130,77 @@ def get_all_issues(
     response_model=ApiResponse[Issue],
 )
 def get_issue_details(uuid: UUID, db: DatabaseSession) -> ApiResponse[Issue]:
+    issue = _get_cached_issue_details("issue", uuid)
+    if issue is not None:
+        return ApiResponse(message="Issue retrieved successfully", data=issue)
+
     issue = db.get(Issue, uuid)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
+    issue = Issue.model_validate(issue)
+    _cache_issue_details("issue", uuid, issue)
     return ApiResponse(message="Issue retrieved successfully", data=issue)
 
 
+def _get_contact_person_name(db: Session, account_uuid: UUID) -> str | None:
+    # an account is either a user or a volunteer; one query finds the name
+    return db.scalar(
+        select(func.coalesce(User.full_name, Volunteer.full_name))
+        .select_from(Account)
+        .outerjoin(User, User.uuid == Account.uuid)  # type: ignore
+        .outerjoin(Volunteer, Volunteer.uuid == Account.uuid)  # type: ignore
+        .where(Account.uuid == account_uuid)
+    )
+
+
+def _issue_details_query(
+    detail_model: type[BloodDonationIssue] | type[LostAndFoundIssue], uuid: UUID
+):
+    # the issue, its category details, the account's contact fields and the
+    # owner's name in one round-trip; responders come from one selectin query
+    return (
+        select(
+            Issue,
+            detail_model,
+            Account.phone_number,
+            Account.email_address,
+            func.coalesce(User.full_name, Volunteer.full_name),
+        )
+        .outerjoin(detail_model, detail_model.uuid == Issue.uuid)  # type: ignore
+        .join(Account, Account.uuid == Issue.account_uuid)  # type: ignore
+        .outerjoin(User, User.uuid == Issue.account_uuid)  # type: ignore
+        .outerjoin(Volunteer, Volunteer.uuid == Issue.account_uuid)  # type: ignore
+        .options(selectinload(Issue.volunteer_responses), *_LAZY_LOAD_GUARD)  # type: ignore
+        .where(Issue.uuid == uuid)
+    )
+
+
+# detail rows share the issue's key and timestamps; those come from the issue
+_ISSUE_DETAIL_EXCLUDE = frozenset({"uuid", "created_at", "last_updated"})
+
+
+def _issue_read_fields(
+    issue: Issue,
+    issue_detail: BloodDonationIssue | LostAndFoundIssue,
+    phone_number: str,
+    email_address: str,
+    contact_person_name: str,
+) -> dict:
+    return {
+        **issue_detail.model_dump(exclude=_ISSUE_DETAIL_EXCLUDE),
+        "issue_uuid": issue.uuid,
+        "status": issue.status,
+        "created_at": issue.created_at,
+        "last_updated": issue.last_updated,
+        "account_uuid": issue.account_uuid,
+        "phone_number": phone_number,
+        "email_address": email_address,
+        "contact_person_name": contact_person_name,
+        "emergency_phone_number": issue.emergency_phone_number,
+        "responders_uuid": [vol.volunteer_uuid for vol in issue.volunteer_responses],
+    }
+
+
 @router.get(
     "/blood_donation/{uuid}",
     summary="Get details of a blood donation issue",
@@ -84,43 +209,31 @@ def get_issue_details(uuid: UUID, db: DatabaseSession) -> ApiResponse[Issue]:
 def get_blood_donation_issue_details(
     uuid: UUID, db: DatabaseSession
 ) -> ApiResponse[BloodDonationIssueRead]:
-    issue = db.get(Issue, uuid)
-    if not issue:
+    data = _get_cached_issue_details("blood_donation", uuid)
+    if data is not None:
+        return ApiResponse(
+            message="Blood donation issue details retrieved successfully", data=data
+        )
+
+    row = db.exec(_issue_details_query(BloodDonationIssue, uuid)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    issue_detail = db.get(BloodDonationIssue, uuid)
+    issue, issue_detail, phone_number, email_address, contact_person_name = row
     if not issue_detail:
         raise HTTPException(
             status_code=404, detail="Blood donation issue details not found"
         )
-    user = db.get(User, issue.account_uuid)
-    volunteer = db.get(Volunteer, issue.account_uuid)
 
-    if user:
-        contact_person_name = user.full_name
-    else:
-        assert volunteer
-        contact_person_name = volunteer.full_name
-
-    data = BloodDonationIssueRead(
-        issue_uuid=issue.uuid,
-        status=issue.status,
-        created_at=issue.created_at,
-        last_updated=issue.last_updated,
-        account_uuid=issue.account_uuid,
-        phone_number=issue.account.phone_number,
-        email_address=issue.account.email_address,
-        patient_name=issue_detail.patient_name,
-        blood_group=issue_detail.blood_group,
-        amount_bag=issue_detail.amount_bag,
-        hospital_name=issue_detail.hospital_name,
-        district=issue_detail.district,
-        upazila=issue_detail.upazila,
-        instructions=issue_detail.instructions,
-        contact_person_name=contact_person_name,
-        emergency_phone_number=issue.emergency_phone_number,
-        responders_uuid=[vol.volunteer_uuid for vol in issue.volunteer_responses],
+    if contact_person_name is None:
+        raise HTTPException(status_code=404, detail="Contact person not found")
+
+    data = BloodDonationIssueRead.model_validate(
+        _issue_read_fields(
+            issue, issue_detail, phone_number, email_address, contact_person_name
+        )
     )
+    _cache_issue_details("blood_donation", uuid, data)
 
     return ApiResponse(
         message="Blood donation issue details retrieved successfully", data=data
@@ -135,45 +248,31 @@ def get_blood_donation_issue_details(
 def get_lost_and_found_issue_details(
     uuid: UUID, db: DatabaseSession
 ) -> ApiResponse[LostAndFoundIssueRead]:
-    issue = db.get(Issue, uuid)
-    if not issue:
+    data = _get_cached_issue_details("lost_and_found", uuid)
+    if data is not None:
+        return ApiResponse(
+            message="Lost and found issue details retrieved successfully", data=data
+        )
+
+    row = db.exec(_issue_details_query(LostAndFoundIssue, uuid)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    issue_detail = db.get(LostAndFoundIssue, uuid)
+    issue, issue_detail, phone_number, email_address, contact_person_name = row
     if not issue_detail:
         raise HTTPException(
             status_code=404, detail="Lost and found issue details not found"
         )
 
-    user = db.get(User, issue.account_uuid)
-    volunteer = db.get(Volunteer, issue.account_uuid)
+    if contact_person_name is None:
+        raise HTTPException(status_code=404, detail="Contact person not found")
 
-    if user:
-        contact_person_name = user.full_name
-    else:
-        assert volunteer
-        contact_person_name = volunteer.full_name
-
-    data = LostAndFoundIssueRead(
-        issue_uuid=issue.uuid,
-        status=issue.status,
-        created_at=issue.created_at,
-        last_updated=issue.last_updated,
-        account_uuid=issue.account_uuid,
-        phone_number=issue.account.phone_number,
-        email_address=issue.account.email_address,
-        name_of_person=issue_detail.name_of_person,
-        age_of_person=issue_detail.age_of_person,
-        last_seen_location=issue_detail.last_seen_location,
-        details=issue_detail.details,
-        district=issue_detail.district,
-        upazila=issue_detail.upazila,
-        blood_group=issue_detail.blood_group,
-        occupation=issue_detail.occupation,
-        contact_person_name=contact_person_name,
-        emergency_phone_number=issue.emergency_phone_number,
-        responders_uuid=[vol.volunteer_uuid for vol in issue.volunteer_responses],
+    data = LostAndFoundIssueRead.model_validate(
+        _issue_read_fields(
+            issue, issue_detail, phone_number, email_address, contact_person_name
+        )
     )
+    _cache_issue_details("lost_and_found", uuid, data)
 
     return ApiResponse(
         message="Lost and found issue details retrieved successfully", data=data
@@ -186,14 +285,33 @@ def get_lost_and_found_issue_details(
     response_model=ApiResponse[list[IssueResponseRead]],
 )
 def get_volunteer_responses_of_issue(uuid: UUID, db: DatabaseSession):
-    issue = db.get(Issue, uuid)
-    if not issue:
+    # the outer join yields one all-NULL response row for an issue without
+    # responses, and no rows at all for a missing issue
+    rows = db.exec(
+        select(
+            VolunteerIssueResponse.volunteer_uuid,
+            VolunteerIssueResponse.status_mark,
+            VolunteerIssueResponse.created_at,
+        )
+        .select_from(Issue)
+        .outerjoin(
+            VolunteerIssueResponse, VolunteerIssueResponse.issue_uuid == Issue.uuid
+        )  # type: ignore
+        .where(Issue.uuid == uuid)
+    ).all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Issue not found")
     return ApiResponse(
         message="Volunteer responses retrieved successfully",
+        # fields come straight from the database, so validation is skipped
         data=[
-            IssueResponseRead.model_validate(response)
-            for response in issue.volunteer_responses
+            IssueResponseRead.model_construct(
+                volunteer_uuid=volunteer_uuid,
+                status_mark=status_mark,
+                created_at=created_at,
+            )
+            for volunteer_uuid, status_mark, created_at in rows
+            if volunteer_uuid is not None
         ],
     )
 
@@ -207,17 +325,14 @@ def _create_user_account(
         email_address=email_address,
         password_hash=hash_password(pin),
     )
-    db.add(account)
-    db.flush()
-
+    # uuids come from default factories, so no flush is needed before the
+    # dependent rows; commit inserts them in foreign key order
     user = User(uuid=account.uuid, full_name=full_name)
-    db.add(user)
+    db.add_all([account, user])
 
     db.commit()
-    db.refresh(account)
-    db.refresh(user)
 
-    send_email(
+    queue_email(
         mailto=email_address,
         subject="Your Temporary Password for Emergency BD Account",
         body=f"""Hello {full_name},
@@ -245,31 +360,37 @@ project.emergencybd@gmail.com | https://emergencybd.com
     return account
 
 
+def _get_or_create_issuer_account_uuid(
+    db: Session, payload: BloodDonationIssueCreate | LostAndFoundIssueCreate
+) -> UUID:
+    # only the key is needed; email_address is unique-indexed, so this is an
+    # index lookup that never loads the account row
+    account_uuid = db.scalar(
+        select(Account.uuid).where(
+            Account.email_address == payload.email_address,
+            Account.phone_number == payload.phone_number,
+        )
+    )
+    if account_uuid:
+        return account_uuid
+    return _create_user_account(
+        db, payload.full_name, payload.phone_number, payload.email_address
+    ).uuid
+
+
 @router.post(
     "/blood_donation/new",
     summary="Create a new blood donation issue",
     response_model=ApiResponse[IssueCreateData],
 )
 def create_blood_donation_issue(payload: BloodDonationIssueCreate, db: DatabaseSession):
-    account = db.scalar(
-        select(Account).where(
-            Account.email_address == payload.email_address,
-            Account.phone_number == payload.phone_number,
-        )
-    )
-    if not account:
-        account = _create_user_account(
-            db, payload.full_name, payload.phone_number, payload.email_address
-        )
+    account_uuid = _get_or_create_issuer_account_uuid(db, payload)
 
     issue = Issue(
-        account_uuid=account.uuid,
+        account_uuid=account_uuid,
         emergency_phone_number=payload.emergency_phone_number,
         category=IssueCategory.blood_donation,
     )
-    db.add(issue)
-    db.flush()
-
     blood_donation_issue = BloodDonationIssue(
         uuid=issue.uuid,
         **payload.model_dump(
@@ -281,11 +402,11 @@ def create_blood_donation_issue(payload: BloodDonationIssueCreate, db: DatabaseS
             }
         ),
     )
-    db.add(blood_donation_issue)
+    db.add_all([issue, blood_donation_issue])
     db.commit()
-    db.refresh(issue)
+    invalidate_cached_issue()
 
-    send_email(
+    queue_email(
         payload.email_address,
         "Your Issue Has Been Created on Emergency Bangladesh",
         f"""
@@ -312,7 +433,9 @@ project.emergencybd@gmail.com | https://emergencybd.com
     )
 
     matched_volunteers = db.exec(
-        select(Volunteer).where(
+        select(Volunteer.full_name, Account.email_address)
+        .join(Account, Account.uuid == Volunteer.uuid)  # type: ignore
+        .where(
             and_(
                 or_(
                     Volunteer.current_district == payload.district,
@@ -322,21 +445,20 @@ project.emergencybd@gmail.com | https://emergencybd.com
                     Volunteer.current_upazila == payload.upazila,
                     Volunteer.permanent_upazila == payload.upazila,
                 ),
-                Volunteer.status
-                not in [VolunteerStatus.rejected, VolunteerStatus.terminated],
+                Volunteer.status.notin_(  # type: ignore
+                    [VolunteerStatus.rejected, VolunteerStatus.terminated]
+                ),
                 Volunteer.blood_group == payload.blood_group,
             )
         )
-    ).all()
-
-    for volunteer in matched_volunteers:
-        send_email(
-            volunteer.account.email_address,
-            f"New Blood Donation Issue at {payload.hospital_name} | Emergency Bangladesh",
-            f"""
-Hello {volunteer.full_name},
+        .execution_options(yield_per=_VOLUNTEER_FAN_OUT_BATCH_SIZE)
+    )
 
-We have received a new blood donation issue at {payload.hospital_name} in {payload.district} district, {payload.upazila} upazila.
+    # everything after the greeting is the same for every volunteer
+    volunteer_email_subject = (
+        f"New Blood Donation Issue at {payload.hospital_name} | Emergency Bangladesh"
+    )
+    volunteer_email_details = f"""We have received a new blood donation issue at {payload.hospital_name} in {payload.district} district, {payload.upazila} upazila.
 
 Details:
 Patient Name: {payload.patient_name}
@@ -356,7 +478,12 @@ Please check the issue on Emergency Bangladesh: https://emergencybd.com/issues/{
 Stay safe,
 Team Emergency Bangladesh
 project.emergencybd@gmail.com | https://emergencybd.com
-""",
+"""
+    for full_name, email_address in matched_volunteers:
+        queue_email(
+            email_address,
+            volunteer_email_subject,
+            f"\nHello {full_name},\n\n{volunteer_email_details}",
             "plain",
         )
 
@@ -372,26 +499,13 @@ project.emergencybd@gmail.com | https://emergencybd.com
     response_model=ApiResponse[IssueCreateData],
 )
 def create_lost_and_found_issue(payload: LostAndFoundIssueCreate, db: DatabaseSession):
-    account = db.scalar(
-        select(Account).where(
-            Account.email_address == payload.email_address,
-            Account.phone_number == payload.phone_number,
-        )
-    )
-
-    if not account:
-        account = _create_user_account(
-            db, payload.full_name, payload.phone_number, payload.email_address
-        )
+    account_uuid = _get_or_create_issuer_account_uuid(db, payload)
 
     issue = Issue(
-        account_uuid=account.uuid,
+        account_uuid=account_uuid,
         emergency_phone_number=payload.emergency_phone_number,
         category=IssueCategory.lost_and_found,
     )
-    db.add(issue)
-    db.flush()
-
     lost_and_found_issue = LostAndFoundIssue(
         uuid=issue.uuid,
         **payload.model_dump(
@@ -403,12 +517,11 @@ def create_lost_and_found_issue(payload: LostAndFoundIssueCreate, db: DatabaseSe
             }
         ),
     )
-    db.add(lost_and_found_issue)
-
+    db.add_all([issue, lost_and_found_issue])
     db.commit()
-    db.refresh(issue)
+    invalidate_cached_issue()
 
-    send_email(
+    queue_email(
         payload.email_address,
         "Your Issue Has Been Created on Emergency Bangladesh",
         f"""
@@ -434,18 +547,18 @@ project.emergencybd@gmail.com | https://emergencybd.com
         "plain",
     )
 
-    matched_volunteers = db.exec(
-        select(Volunteer).where(
-            Volunteer.status
-            not in [VolunteerStatus.rejected, VolunteerStatus.terminated],
+    volunteer_emails = db.exec(
+        select(Account.email_address)
+        .join(Volunteer, Volunteer.uuid == Account.uuid)  # type: ignore
+        .where(
+            Volunteer.status.notin_(  # type: ignore
+                [VolunteerStatus.rejected, VolunteerStatus.terminated]
+            ),
         )
+        .execution_options(yield_per=_VOLUNTEER_FAN_OUT_BATCH_SIZE)
     )
 
-    for volunteer in matched_volunteers:
-        send_email(
-            volunteer.account.email_address,
-            "New Lost and Found Issue | Emergency Bangladesh",
-            f"""
+    volunteer_email_body = f"""
 URGENT!!! A PERSON IS LOST!!!
 
 
@@ -466,7 +579,12 @@ Please check the issue on Emergency Bangladesh: https://emergencybd.com/issues/{
 Stay safe,
 Team Emergency Bangladesh
 project.emergencybd@gmail.com | https://emergencybd.com
-""",
+"""
+    for email_batch in volunteer_emails.partitions():
+        queue_bulk_email(
+            list(email_batch),
+            "New Lost and Found Issue | Emergency Bangladesh",
+            volunteer_email_body,
             "plain",
         )
 
@@ -489,54 +607,78 @@ def create_or_update_issue_response(
         None, description="The status mark for the volunteer's response"
     ),
 ):
-    issue = db.get(Issue, uuid)
+    issue = db.exec(
+        select(Issue)
+        .options(joinedload(Issue.account), *_LAZY_LOAD_GUARD)  # type: ignore
+        .where(Issue.uuid == uuid)
+    ).first()
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    issuer = db.get(User, issue.account_uuid)
-    if not issuer:
+    issuer_name = _get_contact_person_name(db, issue.account_uuid)
+    if not issuer_name:
         raise HTTPException(status_code=404, detail="Issuer not found")
 
-    existing_response = db.scalar(
-        select(VolunteerIssueResponse).where(
-            VolunteerIssueResponse.issue_uuid == uuid,
-            VolunteerIssueResponse.volunteer_uuid == volunteer.uuid,
-        )
+    response = ApiResponse(
+        message="Response recorded.",
+        data=IssueResponseCreateData(
+            issue=uuid,
+            volunteer_uuid=volunteer.uuid,
+            status_mark=status_mark,
+        ),
     )
 
-    if existing_response:
-        existing_response.status_mark = status_mark
-        db.add(existing_response)
-        response_to_return = existing_response
-    else:
-        new_response = VolunteerIssueResponse(
-            issue_uuid=uuid, volunteer_uuid=volunteer.uuid, status_mark=status_mark
+    # one atomic statement; concurrent responses by the same volunteer cannot
+    # create duplicates
+    result = db.exec(
+        sqlite_insert(VolunteerIssueResponse)
+        .values(
+            uuid=uuid4(),
+            issue_uuid=uuid,
+            volunteer_uuid=volunteer.uuid,
+            status_mark=status_mark,
+            created_at=get_utc_time(),
         )
-        db.add(new_response)
-        response_to_return = new_response
-
+        .on_conflict_do_update(
+            index_elements=["issue_uuid", "volunteer_uuid"],
+            set_={"status_mark": status_mark},
+            where=VolunteerIssueResponse.status_mark.is_distinct_from(status_mark),  # type: ignore
+        )
+    )
     db.commit()
-    db.refresh(response_to_return)
+    if not result.rowcount:
+        # the volunteer re-submitted an unchanged response; nothing to redo
+        return response
+    invalidate_cached_issue(uuid)
 
     if status_mark:
-        responses = db.exec(
-            select(VolunteerIssueResponse).where(
-                VolunteerIssueResponse.issue_uuid == uuid,
-                VolunteerIssueResponse.status_mark == status_mark,
+        # the threshold is reached iff the n-th matching response exists; the
+        # database stops scanning there instead of counting every match
+        threshold_reached = (
+            db.scalar(
+                select(literal(1))
+                .select_from(VolunteerIssueResponse)
+                .where(
+                    VolunteerIssueResponse.issue_uuid == uuid,
+                    VolunteerIssueResponse.status_mark == status_mark,
+                )
+                .offset(config.issue_update_min_volunteer_responses - 1)
+                .limit(1)
             )
-        ).all()
+            is not None
+        )
 
-        if len(responses) >= config.issue_update_min_volunteer_responses:
+        if threshold_reached:
             issue.status = IssueStatus(status_mark.value)
             db.add(issue)
             db.commit()
-            db.refresh(issue)
+            invalidate_cached_issue(uuid)
 
-            send_email(
+            queue_email(
                 issue.account.email_address,
                 "Your Issue Has Been Updated on Emergency Bangladesh",
                 f"""
-Hello {issuer.full_name},
+Hello {issuer_name},
 
 Your issue has been updated to {issue.status.value}.
 
@@ -558,11 +700,11 @@ project.emergencybd@gmail.com | https://emergencybd.com
                 "plain",
             )
         else:
-            send_email(
+            queue_email(
                 issue.account.email_address,
                 f"Waiting for approval for your issue to be marked {status_mark.value}",
                 f"""
-Hello {issuer.full_name},
+Hello {issuer_name},
 
 {volunteer.full_name} has responded to your issue.
 Contact:
@@ -590,11 +732,11 @@ project.emergencybd@gmail.com | https://emergencybd.com
             )
             pass
     else:
-        send_email(
+        queue_email(
             issue.account.email_address,
             f"{volunteer.full_name} Has Responded to Your Issue on Emergency Bangladesh",
             f"""
-Hello {issuer.full_name},
+Hello {issuer_name},
 
 {volunteer.full_name} has responded to your issue.
 Contact:
@@ -620,14 +762,7 @@ project.emergencybd@gmail.com | https://emergencybd.com
 """,
             "plain",
         )
-    return ApiResponse(
-        message="Response recorded.",
-        data=IssueResponseCreateData(
-            issue=uuid,
-            volunteer_uuid=volunteer.uuid,
-            status_mark=status_mark,
-        ),
-    )
+    return response
 
 
 @router.patch(
@@ -641,7 +776,11 @@ def update_issue_status(
     actor: RequestingActor,
     issue_status: IssueStatus,
 ):
-    issue = db.get(Issue, uuid)
+    issue = db.exec(
+        select(Issue)
+        .options(joinedload(Issue.account), *_LAZY_LOAD_GUARD)  # type: ignore
+        .where(Issue.uuid == uuid)
+    ).first()
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
@@ -653,22 +792,22 @@ def update_issue_status(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
         )
 
-    issuer = db.get(User, issue.account_uuid)
-    if not issuer:
+    issuer_name = _get_contact_person_name(db, issue.account_uuid)
+    if not issuer_name:
         raise HTTPException(status_code=404, detail="Issuer not found")
 
     issue.status = issue_status
     db.add(issue)
     db.commit()
-    db.refresh(issue)
+    invalidate_cached_issue(issue.uuid)
 
-    send_email(
+    queue_email(
         issue.account.email_address,
         "Your Issue Has Been Updated to "
         + issue.status.value
         + " on Emergency Bangladesh",
         f"""
-Hi {issuer.full_name},
+Hi {issuer_name},
 
 Your issue has been updated to {issue.status.value}.
 
@@ -707,6 +846,7 @@ def delete_issue(uuid: UUID, db: DatabaseSession, _: CurrentAdmin):
 
     db.delete(issue)
     db.commit()
+    invalidate_cached_issue(uuid)
 
     return ApiResponse(
         message="Issue deleted successfully.", data=IssueDeleteData(issue_uuid=uuid)
@@ -12,6 +12,8 @@ from ..global_schema import BaseModel
 class GetIssuesData(BaseModel):
     has_more: bool
     issues: Sequence[Issue]
+    # pass as `after` to fetch the next page; None on the last page
+    next_cursor: str | None = None
 
 
 # Schemas for issue creation
@@ -0,0 +1,20 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+
+# opaque cursors for lists paged by keyset on (created_at, uuid), newest first
+def encode_keyset_cursor(created_at: datetime, uuid: UUID) -> str:
+    return urlsafe_b64encode(f"{created_at.isoformat()}|{uuid}".encode()).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, uuid = urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(uuid)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
@@ -13,9 +13,10 @@ def check_permissions(
     actor: Account | Admin,
     team_uuid: UUID,
     leader_or_co_leader_only: bool = False,
-):
+) -> TeamMember | None:
+    """Returns the actor's membership of the team, or None for an admin."""
     if isinstance(actor, Admin):
-        return True
+        return None
 
     team_member = db.scalar(
         select(TeamMember).where(
@@ -29,7 +30,15 @@ def check_permissions(
             detail="You are not a member of this team.",
         )
 
-    if leader_or_co_leader_only and team_member.role not in [
+    if leader_or_co_leader_only:
+        check_leader_or_co_leader(team_member)
+
+    return team_member
+
+
+def check_leader_or_co_leader(team_member: TeamMember | None) -> None:
+    # None stands for an admin, who passes every check
+    if team_member and team_member.role not in [
         TeamMemberRole.leader,
         TeamMemberRole.co_leader,
     ]:
@@ -37,5 +46,3 @@ def check_permissions(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only team leaders or co-leaders can perform this action.",
         )
-
-    return True
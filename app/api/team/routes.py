@@ -2,8 +2,9 @@ from datetime import date
 from typing import Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
-from sqlmodel import desc, select
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from sqlmodel import desc, func, literal, select, tuple_
 
 from ...database.models.account import Admin
 from ...database.models.team import Team, TeamMember, TeamMemberRole
@@ -16,6 +17,7 @@ from ..dependencies import (
     RequestingActor,
 )
 from ..global_schema import ApiResponse
+from ..pagination import decode_keyset_cursor, encode_keyset_cursor
 from .helper import check_permissions
 from .schema import (
     TeamCreate,
@@ -24,6 +26,7 @@ from .schema import (
     TeamMemberCreateData,
     TeamMemberDeleteData,
     TeamMemberRead,
+    TeamPage,
     TeamRead,
     TeamUpdate,
     TeamUpdateData,
@@ -32,15 +35,52 @@ from .team_plan.routes import router as team_plan_router
 
 router = APIRouter(prefix="/teams", tags=["Team Management"])
 
+# TeamRead's columns, projected in SQL so that team reads never load Team
+# entities or their relationships; members are counted per returned team
+_TEAM_READ_COLUMNS = (
+    Team.uuid,
+    Team.name,
+    Team.expiration_date,
+    Team.leader_uuid,
+    Team.co_leader_uuid,
+    Team.created_at,
+    Team.last_updated,
+    select(func.count())
+    .select_from(TeamMember)
+    .where(TeamMember.team_uuid == Team.uuid)
+    .correlate(Team)
+    .scalar_subquery()
+    .label("members_count"),
+)
+
 
-@router.get("/", response_model=ApiResponse[Sequence[Team]])
+@router.get("/", response_model=TeamPage)
 def get_all_teams(
-    db: DatabaseSession, _: CurrentAdmin, skip: int = 0, limit: int = 100
+    db: DatabaseSession,
+    _: CurrentAdmin,
+    after: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
 ):
-    teams = db.exec(select(Team).offset(skip).limit(limit)).all()
-    return ApiResponse(
+    # keyset pagination, newest first; one extra row tells whether more exist
+    query = (
+        select(*_TEAM_READ_COLUMNS)
+        .order_by(desc(Team.created_at), desc(Team.uuid))
+        .limit(limit + 1)
+    )
+    if after:
+        query = query.where(
+            tuple_(Team.created_at, Team.uuid) < decode_keyset_cursor(after)
+        )
+    rows = db.exec(query).all()
+
+    has_more = len(rows) > limit
+    teams = [TeamRead.model_validate(row) for row in rows[:limit]]
+    last = teams[-1] if has_more else None
+    next_cursor = encode_keyset_cursor(last.created_at, last.uuid) if last else None
+    return TeamPage(
         message="Teams retrieved successfully",
         data=teams,
+        next_cursor=next_cursor,
     )
 
 
@@ -50,35 +90,44 @@ def get_all_teams(
     response_model=ApiResponse[TeamCreateData],
 )
 def create_team(payload: TeamCreate, db: DatabaseSession, volunteer: CurrentVolunteer):
-    if db.scalar(
-        select(Team).where(
-            Team.name == payload.name, Team.expiration_date >= get_utc_time()
+    today = get_utc_time().date()
+    co_leader_uuid = payload.co_leader_uuid
+    # the name check and both co-leader checks run as one SELECT of EXISTS
+    name_taken, co_leader_exists, co_leader_in_active_team = db.exec(
+        select(
+            select(Team.uuid)
+            .where(Team.name == payload.name, Team.expiration_date >= today)
+            .exists(),
+            select(Volunteer.uuid).where(Volunteer.uuid == co_leader_uuid).exists()
+            if co_leader_uuid
+            else literal(True),
+            select(TeamMember.uuid)
+            .join(Team)
+            .where(
+                TeamMember.volunteer_uuid == co_leader_uuid,
+                Team.expiration_date >= today,
+            )
+            .exists()
+            if co_leader_uuid
+            else literal(False),
         )
-    ):
+    ).one()
+
+    if name_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A team with this name already exists.",
         )
-
-    if payload.co_leader_uuid:
-        co_leader = db.get(Volunteer, payload.co_leader_uuid)
-        if not co_leader:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Co-leader volunteer not found.",
-            )
-
-        ## I can feal this weird variable naming!
-        if _existing_member_ := db.scalar(
-            select(TeamMember)
-            .where(TeamMember.volunteer_uuid == co_leader.uuid)
-            .order_by(desc(TeamMember.joined_at))
-        ):
-            if _existing_member_.team.expiration_date >= get_utc_time():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Co-leader is already a member of another team.",
-                )
+    if not co_leader_exists:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Co-leader volunteer not found.",
+        )
+    if co_leader_in_active_team:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Co-leader is already a member of another team.",
+        )
 
     team = Team(
         name=payload.name,
@@ -86,8 +135,9 @@ def create_team(payload: TeamCreate, db: DatabaseSession, volunteer: CurrentVolu
         leader_uuid=volunteer.uuid,
         co_leader_uuid=payload.co_leader_uuid,
     )
+    # team.uuid comes from a default factory, so the members can reference it
+    # before anything is flushed; commit inserts the team first
     db.add(team)
-    db.flush()
 
     # Add leader and co-leader as members
     db.add(
@@ -107,7 +157,6 @@ def create_team(payload: TeamCreate, db: DatabaseSession, volunteer: CurrentVolu
         )
 
     db.commit()
-    db.refresh(team)
 
     return ApiResponse(
         message="Team created successfully.", data=TeamCreateData(team_uuid=team.uuid)
@@ -116,23 +165,13 @@ def create_team(payload: TeamCreate, db: DatabaseSession, volunteer: CurrentVolu
 
 @router.get("/{uuid}", response_model=ApiResponse[TeamRead], summary="Get Team by uuid")
 def get_team_by_uuid(uuid: UUID, db: DatabaseSession) -> ApiResponse[TeamRead]:
-    team = db.get(Team, uuid)
-    if not team:
+    row = db.exec(select(*_TEAM_READ_COLUMNS).where(Team.uuid == uuid)).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found."
         )
     return ApiResponse(
-        message="Team retrieved successfully",
-        data=TeamRead(
-            uuid=team.uuid,
-            name=team.name,
-            leader_uuid=team.leader_uuid,
-            co_leader_uuid=team.co_leader_uuid,
-            expiration_date=team.expiration_date,
-            created_at=team.created_at,
-            last_updated=team.last_updated,
-            members_count=len(team.members),
-        ),
+        message="Team retrieved successfully", data=TeamRead.model_validate(row)
     )
 
 
@@ -159,91 +198,89 @@ def update_team(
     if payload.expiration_date:
         team.expiration_date = payload.expiration_date
 
-    if payload.leader_uuid and payload.leader_uuid != team.leader_uuid:
-        new_leader_uuid = payload.leader_uuid
-        if not db.get(Volunteer, new_leader_uuid):
+    new_leader_uuid = (
+        payload.leader_uuid
+        if payload.leader_uuid and payload.leader_uuid != team.leader_uuid
+        else None
+    )
+    new_co_leader_uuid = (
+        payload.co_leader_uuid
+        if payload.co_leader_uuid and payload.co_leader_uuid != team.co_leader_uuid
+        else None
+    )
+
+    if new_leader_uuid or new_co_leader_uuid:
+        # one query checks both new volunteers exist, and one fetches every
+        # membership the role changes below touch
+        new_uuids = {new_leader_uuid, new_co_leader_uuid} - {None}
+        existing_volunteers = set(
+            db.exec(
+                select(Volunteer.uuid).where(Volunteer.uuid.in_(new_uuids))  # type: ignore
+            ).all()
+        )
+        if new_leader_uuid and new_leader_uuid not in existing_volunteers:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="New leader volunteer not found.",
             )
-
-        # Update old leader's role to member
-        old_leader_member = db.scalar(
-            select(TeamMember).where(
-                TeamMember.team_uuid == uuid,
-                TeamMember.volunteer_uuid == team.leader_uuid,
-            )
-        )
-        if old_leader_member:
-            old_leader_member.role = TeamMemberRole.member
-            db.add(old_leader_member)
-
-        team.leader_uuid = new_leader_uuid
-
-        # Update new leader's role
-        new_leader_member = db.scalar(
-            select(TeamMember).where(
-                TeamMember.team_uuid == uuid,
-                TeamMember.volunteer_uuid == new_leader_uuid,
-            )
-        )
-        if new_leader_member:
-            new_leader_member.role = TeamMemberRole.leader
-            db.add(new_leader_member)
-        else:
-            db.add(
-                TeamMember(
-                    team_uuid=uuid,
-                    volunteer_uuid=new_leader_uuid,
-                    role=TeamMemberRole.leader,
-                )
-            )
-
-    if payload.co_leader_uuid and payload.co_leader_uuid != team.co_leader_uuid:
-        new_co_leader_uuid = payload.co_leader_uuid
-        if not db.get(Volunteer, new_co_leader_uuid):
+        if new_co_leader_uuid and new_co_leader_uuid not in existing_volunteers:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="New co-leader volunteer not found.",
             )
 
-        # Update old co-leader's role to member
-        if team.co_leader_uuid:
-            old_co_leader_member = db.scalar(
+        members = {
+            member.volunteer_uuid: member
+            for member in db.exec(
                 select(TeamMember).where(
                     TeamMember.team_uuid == uuid,
-                    TeamMember.volunteer_uuid == team.co_leader_uuid,
+                    TeamMember.volunteer_uuid.in_(  # type: ignore
+                        (new_uuids | {team.leader_uuid, team.co_leader_uuid}) - {None}
+                    ),
                 )
-            )
-            if old_co_leader_member:
-                old_co_leader_member.role = TeamMemberRole.member
-                db.add(old_co_leader_member)
+            ).all()
+        }
 
-        team.co_leader_uuid = new_co_leader_uuid
+        if new_leader_uuid:
+            # Update old leader's role to member
+            if old_leader_member := members.get(team.leader_uuid):
+                old_leader_member.role = TeamMemberRole.member
 
-        # Update new co-leader's role
-        if new_co_leader_uuid:
-            new_co_leader_member = db.scalar(
-                select(TeamMember).where(
-                    TeamMember.team_uuid == uuid,
-                    TeamMember.volunteer_uuid == new_co_leader_uuid,
+            team.leader_uuid = new_leader_uuid
+
+            # Update new leader's role
+            if new_leader_member := members.get(new_leader_uuid):
+                new_leader_member.role = TeamMemberRole.leader
+            else:
+                members[new_leader_uuid] = TeamMember(
+                    team_uuid=uuid,
+                    volunteer_uuid=new_leader_uuid,
+                    role=TeamMemberRole.leader,
                 )
-            )
-            if new_co_leader_member:
+                db.add(members[new_leader_uuid])
+
+        if new_co_leader_uuid:
+            # Update old co-leader's role to member
+            if team.co_leader_uuid and (
+                old_co_leader_member := members.get(team.co_leader_uuid)
+            ):
+                old_co_leader_member.role = TeamMemberRole.member
+
+            team.co_leader_uuid = new_co_leader_uuid
+
+            # Update new co-leader's role
+            if new_co_leader_member := members.get(new_co_leader_uuid):
                 new_co_leader_member.role = TeamMemberRole.co_leader
-                db.add(new_co_leader_member)
             else:
-                db.add(
-                    TeamMember(
-                        team_uuid=uuid,
-                        volunteer_uuid=new_co_leader_uuid,
-                        role=TeamMemberRole.co_leader,
-                    )
+                members[new_co_leader_uuid] = TeamMember(
+                    team_uuid=uuid,
+                    volunteer_uuid=new_co_leader_uuid,
+                    role=TeamMemberRole.co_leader,
                 )
+                db.add(members[new_co_leader_uuid])
 
     db.add(team)
     db.commit()
-    db.refresh(team)
 
     return ApiResponse(
         message="Team updated successfully.", data=TeamUpdateData(team_uuid=team.uuid)
@@ -262,9 +299,25 @@ def get_all_team_members(uuid: UUID, db: DatabaseSession, actor: RequestingActor
 
     check_permissions(db, actor, uuid, False)
 
-    return ApiResponse(
-        message="Fetched members successfully",
-        data=[TeamMemberRead.model_validate(member) for member in team.members],
+    members = db.exec(
+        select(
+            TeamMember.team_uuid,
+            TeamMember.volunteer_uuid,
+            TeamMember.role,
+            TeamMember.joined_at,
+        ).where(TeamMember.team_uuid == uuid)
+    ).mappings()
+    # TeamMemberRead's columns encoded by orjson as plain rows, without a
+    # model per member; OPT_UTC_Z keeps pydantic's "Z" suffix
+    return Response(
+        content=orjson.dumps(
+            {
+                "message": "Fetched members successfully",
+                "data": [dict(member) for member in members],
+            },
+            option=orjson.OPT_UTC_Z,
+        ),
+        media_type="application/json",
     )
 
 
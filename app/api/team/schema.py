@@ -2,7 +2,7 @@ from datetime import date, datetime
 from uuid import UUID
 
 from ...database.models.team import TeamMemberRole
-from ..global_schema import BaseModel
+from ..global_schema import ApiResponse, BaseModel
 
 
 class TeamRead(BaseModel):
@@ -15,6 +15,13 @@ class TeamRead(BaseModel):
     last_updated: datetime
     members_count: int
 
+    model_config = {"from_attributes": True}
+
+
+class TeamPage(ApiResponse[list[TeamRead]]):
+    # pass as `after` to fetch the next page; None on the last page
+    next_cursor: str | None = None
+
 
 class TeamCreate(BaseModel):
     name: str
@@ -1,12 +1,14 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Response, status
+from sqlmodel import select
 
 from ....database.models.team import Team
 from ....database.models.team_plan import ActivityUpdate, PlanActivity, TeamPlan
 from ...dependencies import DatabaseSession, LoggedInAccount
 from ...global_schema import ApiResponse
-from ..helper import check_permissions
+from ..helper import check_leader_or_co_leader, check_permissions
 from .schema import (
     ActivityUpdateCreate,
     ActivityUpdateCreateData,
@@ -38,9 +40,31 @@ def get_team_plans(uuid: UUID, db: DatabaseSession, account: LoggedInAccount):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
         )
-    return ApiResponse(
-        message="Team plans retrieved successfully",
-        data=[TeamPlanRead.model_validate(plan) for plan in team.plans],
+    plans = db.exec(
+        select(
+            TeamPlan.uuid.label("plan_uuid"),  # type: ignore
+            TeamPlan.title,
+            TeamPlan.description,
+            TeamPlan.team_uuid,
+            TeamPlan.target_district.label("working_district"),  # type: ignore
+            TeamPlan.target_upazila.label("working_upazila"),  # type: ignore
+            TeamPlan.start_date,
+            TeamPlan.end_date,
+            TeamPlan.created_at,
+            TeamPlan.last_updated,
+        ).where(TeamPlan.team_uuid == uuid)
+    ).mappings()
+    # TeamPlanRead's columns encoded by orjson as plain rows, without a model
+    # per plan; OPT_UTC_Z keeps pydantic's "Z" suffix
+    return Response(
+        content=orjson.dumps(
+            {
+                "message": "Team plans retrieved successfully",
+                "data": [dict(plan) for plan in plans],
+            },
+            option=orjson.OPT_UTC_Z,
+        ),
+        media_type="application/json",
     )
 
 
@@ -65,7 +89,6 @@ def create_team_plan(
     plan = TeamPlan(**payload.model_dump(), uuid=uuid)
     db.add(plan)
     db.commit()
-    db.refresh(plan)
     return ApiResponse(
         message="Plan created successfully.",
         data=TeamPlanCreateData(plan_uuid=plan.uuid),
@@ -92,7 +115,6 @@ def update_team_plan(
 
     db.add(plan)
     db.commit()
-    db.refresh(plan)
     return ApiResponse(
         message="Plan updated successfully.",
         data=TeamPlanUpdateData(plan_uuid=plan.uuid),
@@ -127,8 +149,11 @@ def get_plan_activities(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found"
         )
+    activities = db.exec(
+        select(PlanActivity).where(PlanActivity.plan_uuid == plan_id)
+    ).all()
     return ApiResponse(
-        message="Plan activities retrieved successfully", data=plan.activities
+        message="Plan activities retrieved successfully", data=activities
     )
 
 
@@ -154,7 +179,6 @@ def create_plan_activity(
     activity = PlanActivity(**payload.model_dump(), plan_uuid=plan_id)
     db.add(activity)
     db.commit()
-    db.refresh(activity)
     return ApiResponse(
         message="Activity logged successfully.",
         data=PlanActivityCreateData(activity_uuid=activity.uuid),
@@ -191,7 +215,6 @@ def update_plan_activity(
 
     db.add(activity)
     db.commit()
-    db.refresh(activity)
     return ApiResponse(
         message="Activity updated successfully.",
         data=PlanActivityUpdateData(activity_uuid=activity.uuid),
@@ -254,9 +277,10 @@ def get_activity_updates(
             status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found"
         )
 
-    return ApiResponse(
-        message="Activity updates retrieved successfully", data=activity.updates
-    )
+    updates = db.exec(
+        select(ActivityUpdate).where(ActivityUpdate.activity_uuid == activity_id)
+    ).all()
+    return ApiResponse(message="Activity updates retrieved successfully", data=updates)
 
 
 @router.post(
@@ -272,7 +296,7 @@ def create_activity_update(
     db: DatabaseSession,
     account: LoggedInAccount,
 ):
-    check_permissions(db, account, uuid)
+    team_member = check_permissions(db, account, uuid)
     activity = db.get(PlanActivity, activity_id)
     if not activity or activity.plan_uuid != plan_id:
         raise HTTPException(
@@ -286,12 +310,11 @@ def create_activity_update(
         )
 
     if payload.volunteer_uuid != account.uuid:
-        check_permissions(db, account, uuid, leader_or_co_leader_only=True)
+        check_leader_or_co_leader(team_member)
 
     update = ActivityUpdate(**payload.model_dump(), activity_uuid=activity_id)
     db.add(update)
     db.commit()
-    db.refresh(update)
     return ApiResponse(
         message="Activity update added successfully.",
         data=ActivityUpdateCreateData(update_uuid=update.uuid),
@@ -311,7 +334,7 @@ def update_activity_update(
     db: DatabaseSession,
     account: LoggedInAccount,
 ):
-    check_permissions(db, account, uuid)
+    team_member = check_permissions(db, account, uuid)
     update = db.get(ActivityUpdate, update_id)
     if not update or update.activity_uuid != activity_id:
         raise HTTPException(
@@ -331,14 +354,13 @@ def update_activity_update(
         )
 
     if update.volunteer_uuid != account.uuid:
-        check_permissions(db, account, uuid, leader_or_co_leader_only=True)
+        check_leader_or_co_leader(team_member)
 
     for key, value in payload.model_dump(exclude_unset=True).items():
         setattr(update, key, value)
 
     db.add(update)
     db.commit()
-    db.refresh(update)
     return ApiResponse(
         message="Activity update updated successfully.",
         data=ActivityUpdateUpdateData(update_uuid=update.uuid),
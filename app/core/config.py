@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 from uuid import UUID
@@ -54,6 +54,14 @@ class AppConfig(BaseSettings):
     nid_dir: Path = upload_dir / "nid_images"
     profile_pic_dir: Path = upload_dir / "profile_pics"
     lost_and_found_dir: Path = upload_dir / "lost_and_found_images"
+    # when set, public images are sent by nginx through X-Accel-Redirect; the
+    # prefix must be an `internal` location aliased to upload_dir
+    image_accel_redirect_prefix: str | None = Field(
+        None, validation_alias="IMAGE_ACCEL_REDIRECT_PREFIX"
+    )
+    # when enabled, public images are sent by Apache mod_xsendfile through
+    # X-Sendfile; upload_dir must be listed in XSendFilePath
+    image_x_sendfile: bool = Field(False, validation_alias="IMAGE_X_SENDFILE")
 
     # password settings
     password_min_len: int = 8
@@ -73,87 +81,69 @@ class AppConfig(BaseSettings):
         self.lost_and_found_dir.mkdir(parents=True, exist_ok=True)
         return self
 
-    @property
-    def _cookie_settings(self) -> dict[str, Any]:
+    @staticmethod
+    def _cookie_base(key: str, max_age: int) -> dict[str, Any]:
+        # an integer `expires` is rendered relative to the moment the cookie is set
         return dict(
+            key=key,
+            max_age=max_age,
+            expires=max_age,
             httponly=True,
             samesite="none",
             secure=True,
         )
 
-    def access_token_cookie_options(self, access_token: str) -> dict[str, Any]:
-        return dict(
-            key=self.jwt_access_key,
-            value=access_token,
-            max_age=self.jwt_access_token_expiration,
-            expires=(
-                datetime.now(timezone.utc)
-                + timedelta(seconds=self.jwt_access_token_expiration)
-            ),
-            **self._cookie_settings,
+    @cached_property
+    def _access_token_cookie_base(self) -> dict[str, Any]:
+        return self._cookie_base(self.jwt_access_key, self.jwt_access_token_expiration)
+
+    @cached_property
+    def _admin_access_token_cookie_base(self) -> dict[str, Any]:
+        return self._cookie_base(
+            self.jwt_admin_access_key, self.jwt_access_token_expiration
         )
 
-    def admin_access_token_cookie_options(self, access_token: str) -> dict[str, Any]:
-        return dict(
-            key=self.jwt_admin_access_key,
-            value=access_token,
-            max_age=self.jwt_access_token_expiration,
-            expires=(
-                datetime.now(timezone.utc)
-                + timedelta(seconds=self.jwt_access_token_expiration)
-            ),
-            **self._cookie_settings,
+    @cached_property
+    def _refresh_token_cookie_base(self) -> dict[str, Any]:
+        return self._cookie_base(
+            self.jwt_refresh_key, self.jwt_refresh_token_expiration
         )
 
-    def refresh_token_cookie_options(self, refresh_token: str) -> dict[str, Any]:
-        return dict(
-            key=self.jwt_refresh_key,
-            value=refresh_token,
-            max_age=self.jwt_refresh_token_expiration,
-            expires=(
-                datetime.now(timezone.utc)
-                + timedelta(seconds=self.jwt_refresh_token_expiration)
-            ),
-            **self._cookie_settings,
+    @cached_property
+    def _admin_refresh_token_cookie_base(self) -> dict[str, Any]:
+        return self._cookie_base(
+            self.jwt_admin_refresh_key, self.jwt_access_token_expiration * 5
         )
 
-    def admin_refresh_token_cookie_options(self, refresh_token: str) -> dict[str, Any]:
-        return dict(
-            key=self.jwt_admin_refresh_key,
-            value=refresh_token,
-            max_age=self.jwt_access_token_expiration * 5,
-            expires=(
-                datetime.now(timezone.utc)
-                + timedelta(seconds=self.jwt_access_token_expiration * 5)
-            ),
-            **self._cookie_settings,
+    @cached_property
+    def _otp_token_cookie_base(self) -> dict[str, Any]:
+        return self._cookie_base(self.jwt_otp_key, self.jwt_otp_token_expiration)
+
+    @cached_property
+    def _password_reset_token_cookie_base(self) -> dict[str, Any]:
+        return self._cookie_base(
+            self.jwt_password_reset_key, self.jwt_password_reset_token_expiration
         )
 
+    def access_token_cookie_options(self, access_token: str) -> dict[str, Any]:
+        return {**self._access_token_cookie_base, "value": access_token}
+
+    def admin_access_token_cookie_options(self, access_token: str) -> dict[str, Any]:
+        return {**self._admin_access_token_cookie_base, "value": access_token}
+
+    def refresh_token_cookie_options(self, refresh_token: str) -> dict[str, Any]:
+        return {**self._refresh_token_cookie_base, "value": refresh_token}
+
+    def admin_refresh_token_cookie_options(self, refresh_token: str) -> dict[str, Any]:
+        return {**self._admin_refresh_token_cookie_base, "value": refresh_token}
+
     def otp_token_cookie_options(self, otp_token: str) -> dict[str, Any]:
-        return dict(
-            key=self.jwt_otp_key,
-            value=otp_token,
-            max_age=self.jwt_otp_token_expiration,
-            expires=(
-                datetime.now(timezone.utc)
-                + timedelta(seconds=self.jwt_otp_token_expiration)
-            ),
-            **self._cookie_settings,
-        )
+        return {**self._otp_token_cookie_base, "value": otp_token}
 
     def password_reset_token_cookie_options(
         self, password_reset_token: str
     ) -> dict[str, Any]:
-        return dict(
-            key=self.jwt_password_reset_key,
-            value=password_reset_token,
-            max_age=self.jwt_password_reset_token_expiration,
-            expires=(
-                datetime.now(timezone.utc)
-                + timedelta(seconds=self.jwt_password_reset_token_expiration)
-            ),
-            **self._cookie_settings,
-        )
+        return {**self._password_reset_token_cookie_base, "value": password_reset_token}
 
     def construct_nid_first_image_path(self, volunteer_uuid: UUID) -> Path:
         return self.nid_dir / f"{volunteer_uuid}_nid_first.encrypted"
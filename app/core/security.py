@@ -1,6 +1,8 @@
+import asyncio
 import base64
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from argon2 import PasswordHasher
@@ -10,7 +12,12 @@ from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from .config import config
 
-argon2_hasher = PasswordHasher(time_cost=2, memory_cost=32000, parallelism=1)
+argon2_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+# argon2 releases the GIL while hashing, so threads run in parallel; the bound
+# keeps concurrent hashes (and their memory_cost each) to one per core
+password_hashing_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hashing"
+)
 key = base64.b64decode(config.app_key)
 enc = AESGCM(key)
 
@@ -26,6 +33,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    return argon2_hasher.check_needs_rehash(hashed_password)
+
+
+async def hash_password_async(plain_password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_hashing_pool, hash_password, plain_password
+    )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_hashing_pool, verify_password, plain_password, hashed_password
+    )
+
+
 def validate_password(password: str):
     if len(password) < config.password_min_len:
         raise ValueError("Password must be at least 8 characters long")
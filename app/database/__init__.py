@@ -1,7 +1,33 @@
+from sqlalchemy import inspect, text
 from sqlmodel import SQLModel
 
 from .engine import emr_engine
 
 
+def _drop_duplicate_issue_responses() -> None:
+    # responses used to be written with SELECT-then-INSERT, which could race;
+    # keep the latest row per (issue, volunteer) so the unique index can be built
+    with emr_engine.begin() as connection:
+        indexes = inspect(connection).get_indexes("volunteerissueresponse")
+        if any(
+            index["name"] == "ix_volunteerissueresponse_issue_uuid_volunteer_uuid"
+            for index in indexes
+        ):
+            return
+        connection.execute(
+            text(
+                "DELETE FROM volunteerissueresponse WHERE rowid NOT IN ("
+                "SELECT MAX(rowid) FROM volunteerissueresponse "
+                "GROUP BY issue_uuid, volunteer_uuid)"
+            )
+        )
+
+
 def create_database():
     SQLModel.metadata.create_all(bind=emr_engine)
+    _drop_duplicate_issue_responses()
+    # create_all skips tables that already exist, including their indexes, so
+    # indexes added to existing models are created here
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=emr_engine, checkfirst=True)
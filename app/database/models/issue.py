@@ -3,6 +3,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 from ...types.datetime_utc import SADateTimeUTC
@@ -38,6 +39,11 @@ class IssueResponseStatus(str, Enum):
 
 
 class Issue(SQLModel, table=True):
+    __table_args__ = (
+        # keyset pagination of GET /issues/ walks this index newest first
+        Index("ix_issue_created_at_uuid", "created_at", "uuid"),
+    )
+
     uuid: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     account_uuid: UUID = Field(
         foreign_key="account.uuid", index=True, ondelete="CASCADE"
@@ -118,6 +124,16 @@ class LostAndFoundIssue(SQLModel, table=True):
 
 
 class VolunteerIssueResponse(SQLModel, table=True):
+    __table_args__ = (
+        # a volunteer has one response per issue, upserted on conflict
+        Index(
+            "ix_volunteerissueresponse_issue_uuid_volunteer_uuid",
+            "issue_uuid",
+            "volunteer_uuid",
+            unique=True,
+        ),
+    )
+
     uuid: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     issue_uuid: UUID = Field(foreign_key="issue.uuid", index=True)
     volunteer_uuid: UUID = Field(
@@ -76,7 +76,7 @@ class ExpenseRecord(SQLModel, table=True):
     note: str | None = Field(None)
 
     created_at: datetime = Field(
-        default_factory=get_utc_time, sa_column=Column(SADateTimeUTC)
+        default_factory=get_utc_time, sa_column=Column(SADateTimeUTC, index=True)
     )
     last_updated: datetime = Field(
         default_factory=get_utc_time, sa_column=Column(SADateTimeUTC)
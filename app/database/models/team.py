@@ -3,6 +3,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 from ...types.datetime_utc import SADateTimeUTC
@@ -20,6 +21,11 @@ class TeamMemberRole(str, Enum):
 
 
 class Team(SQLModel, table=True):
+    __table_args__ = (
+        # keyset pagination of GET /teams/ walks this index newest first
+        Index("ix_team_created_at_uuid", "created_at", "uuid"),
+    )
+
     uuid: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     name: str = Field(index=True, unique=True)
     expiration_date: date = Field(index=True)
@@ -51,6 +57,12 @@ class Team(SQLModel, table=True):
 
 
 class TeamMember(SQLModel, table=True):
+    __table_args__ = (
+        # permission and role checks filter on both columns. Not unique: a
+        # volunteer can be added again once the team has expired
+        Index("ix_teammember_team_uuid_volunteer_uuid", "team_uuid", "volunteer_uuid"),
+    )
+
     uuid: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     team_uuid: UUID = Field(foreign_key="team.uuid", index=True, ondelete="CASCADE")
     volunteer_uuid: UUID = Field(
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, text
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 from ...types.datetime_utc import SADateTimeUTC
@@ -12,6 +13,16 @@ if TYPE_CHECKING:
 
 
 class RefreshToken(SQLModel, table=True):
+    __table_args__ = (
+        # only redeemable tokens are looked up by jti; revoked ones drop out
+        Index(
+            "ix_refreshtoken_refresh_token_jti_active",
+            "refresh_token_jti",
+            unique=True,
+            sqlite_where=text("revoked = 0"),
+        ),
+    )
+
     uuid: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     account_uuid: UUID = Field(
         foreign_key="account.uuid", index=True, ondelete="CASCADE"
@@ -4,5 +4,7 @@ from .engine import emr_engine
 
 
 async def get_database_session():
-    with Session(emr_engine) as session:
+    # instances stay readable after commit, so handlers can build their
+    # response without a reload SELECT per expired object
+    with Session(emr_engine, expire_on_commit=False) as session:
         yield session
@@ -1,6 +1,11 @@
+from threading import Lock
+from typing import Any
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached, object_session
 from sqlmodel import Session, select
 
 from ..core.config import config
@@ -9,6 +14,69 @@ from ..database.models.volunteer import Volunteer, VolunteerStatus
 from ..database.session import get_database_session
 from .token import decode_token
 
+# column snapshots of recently seen active accounts, keyed by uuid, so that
+# authenticated requests can skip the account SELECT
+_account_cache: TTLCache[UUID, dict[str, Any]] = TTLCache(maxsize=50_000, ttl=60)
+_account_cache_lock = Lock()
+_account_columns = tuple(column.key for column in Account.__table__.columns)  # type: ignore
+# bumped on every invalidation; a lookup only caches its row if no invalidation
+# happened while it was reading, so a pre-commit read cannot be cached late
+_account_cache_generation = 0
+# session.info key for accounts flushed in the session's open transaction
+_CHANGED_ACCOUNTS = "changed_account_uuids"
+
+
+def invalidate_cached_account(uuid: UUID) -> None:
+    global _account_cache_generation
+    with _account_cache_lock:
+        _account_cache.pop(uuid, None)
+        _account_cache_generation += 1
+
+
+@event.listens_for(Account, "after_update")
+@event.listens_for(Account, "after_delete")
+def _invalidate_changed_account(_mapper: Any, _connection: Any, account: Account):
+    # flush happens before commit, so the entry is dropped again after commit
+    invalidate_cached_account(account.uuid)
+    session = object_session(account)
+    if session is not None:
+        session.info.setdefault(_CHANGED_ACCOUNTS, set()).add(account.uuid)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_accounts(session: Session):
+    for uuid in session.info.pop(_CHANGED_ACCOUNTS, ()):
+        invalidate_cached_account(uuid)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_rolled_back_accounts(session: Session, _previous_transaction: Any):
+    # a savepoint rollback leaves the outer transaction's changes pending
+    if not session.in_transaction():
+        session.info.pop(_CHANGED_ACCOUNTS, None)
+
+
+def _get_active_account(database_session: Session, uuid: UUID) -> Account | None:
+    with _account_cache_lock:
+        snapshot = _account_cache.get(uuid)
+        generation = _account_cache_generation
+    if snapshot is not None:
+        cached = Account(**snapshot)
+        make_transient_to_detached(cached)
+        return database_session.merge(cached, load=False)
+
+    account = database_session.scalar(
+        select(Account).where(
+            Account.uuid == uuid, Account.status == AccountStatus.active
+        )
+    )
+    if account:
+        snapshot = {key: getattr(account, key) for key in _account_columns}
+        with _account_cache_lock:
+            if generation == _account_cache_generation:
+                _account_cache[uuid] = snapshot
+    return account
+
 
 def _get_jwt_access_token_from_request(request: Request):
     token = request.cookies.get(config.jwt_access_key)
@@ -50,11 +118,7 @@ def get_logged_in_account(
 ):
     token = _get_jwt_access_token_from_request(request)
     uuid = _get_uuid_from_token(token)
-    account = database_session.scalar(
-        select(Account).where(
-            Account.uuid == uuid, Account.status == AccountStatus.active
-        )
-    )
+    account = _get_active_account(database_session, uuid)
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -144,11 +208,7 @@ def get_requesting_actor(
             uuid_str: str | None = payload.get("uuid")
             if uuid_str:
                 uuid = UUID(uuid_str)
-                account = db.scalar(
-                    select(Account).where(
-                        Account.uuid == uuid, Account.status == AccountStatus.active
-                    )
-                )
+                account = _get_active_account(db, uuid)
                 if account:
                     return account
         except Exception:
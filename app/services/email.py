@@ -1,21 +1,32 @@
 import email.utils
+import logging
 import smtplib
 import ssl
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Literal
 
 from ..core.config import config
 
+logger = logging.getLogger(__name__)
 
-def send_email(
+# queued emails are delivered one at a time by a single worker thread, which
+# keeps its SMTP session open between messages
+_email_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email")
+_queued_email_connection: smtplib.SMTP | None = None
+# recipients per bulk message; SMTP servers commonly cap RCPT TO at 100
+_BULK_EMAIL_BATCH_SIZE = 100
+
+
+def _build_message(
     mailto: str,
     subject: str,
     body: str,
     content_type: Literal["html", "plain"],
     cc: list[str] | None = None,
-) -> None:
+) -> MIMEMultipart:
     message = MIMEMultipart()
     message.attach(MIMEText(body, content_type))
     message["From"] = config.smtp_mailfrom
@@ -25,7 +36,10 @@ def send_email(
     message["Reply-To"] = config.smtp_mailfrom
     message["Message-ID"] = f"<{uuid.uuid4()}@{config.smtp_server}>"
     message["Date"] = email.utils.formatdate(localtime=True)
+    return message
 
+
+def _connect() -> smtplib.SMTP:
     is_ssl = config.smtp_port == 465
     server = (
         smtplib.SMTP_SSL(
@@ -40,6 +54,19 @@ def send_email(
         server.starttls(context=ssl.create_default_context())
 
     server.login(config.smtp_mailfrom, config.smtp_mailfrom_password)
+    return server
+
+
+def send_email(
+    mailto: str,
+    subject: str,
+    body: str,
+    content_type: Literal["html", "plain"],
+    cc: list[str] | None = None,
+) -> None:
+    message = _build_message(mailto, subject, body, content_type, cc)
+
+    server = _connect()
     server.sendmail(
         config.smtp_mailfrom,
         list(set([mailto] + (cc or []))),
@@ -49,3 +76,97 @@ def send_email(
     server.quit()
 
     print(f"Email sent to {mailto} with CC: {cc} successfully!")
+
+
+def _sendmail_on_queued_connection(recipients: list[str], message: str) -> None:
+    global _queued_email_connection
+
+    for attempt in range(2):
+        if _queued_email_connection is None:
+            _queued_email_connection = _connect()
+        try:
+            _queued_email_connection.sendmail(config.smtp_mailfrom, recipients, message)
+            return
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # the server dropped the idle session; reconnect once and retry
+            _queued_email_connection.close()
+            _queued_email_connection = None
+            if attempt:
+                raise
+
+
+def _send_queued_email(
+    mailto: str,
+    subject: str,
+    body: str,
+    content_type: Literal["html", "plain"],
+    cc: list[str] | None = None,
+) -> None:
+    message = _build_message(mailto, subject, body, content_type, cc)
+    _sendmail_on_queued_connection(
+        list(set([mailto] + (cc or []))), message.as_string()
+    )
+
+    logger.info("Email sent to %s with CC: %s", mailto, cc)
+
+
+def _send_queued_bulk_email(
+    recipients: list[str],
+    subject: str,
+    body: str,
+    content_type: Literal["html", "plain"],
+) -> None:
+    # addressed to ourselves; recipients only appear in the envelope (BCC)
+    message = _build_message(config.smtp_mailfrom, subject, body, content_type)
+    message_string = message.as_string()
+    for start in range(0, len(recipients), _BULK_EMAIL_BATCH_SIZE):
+        _sendmail_on_queued_connection(
+            recipients[start : start + _BULK_EMAIL_BATCH_SIZE], message_string
+        )
+
+    logger.info("Bulk email sent to %d recipients", len(recipients))
+
+
+def _log_failed_email(future: Future[None]) -> None:
+    if exc := future.exception():
+        logger.error("Failed to send queued email", exc_info=exc)
+
+
+def queue_email(
+    mailto: str,
+    subject: str,
+    body: str,
+    content_type: Literal["html", "plain"],
+    cc: list[str] | None = None,
+) -> None:
+    future = _email_executor.submit(
+        _send_queued_email, mailto, subject, body, content_type, cc
+    )
+    future.add_done_callback(_log_failed_email)
+
+
+def queue_bulk_email(
+    recipients: list[str],
+    subject: str,
+    body: str,
+    content_type: Literal["html", "plain"],
+) -> None:
+    """Queues one identical message to all `recipients`, sent as BCC."""
+    if not recipients:
+        return
+    future = _email_executor.submit(
+        _send_queued_bulk_email, recipients, subject, body, content_type
+    )
+    future.add_done_callback(_log_failed_email)
+
+
+def shutdown_email_queue() -> None:
+    global _queued_email_connection
+
+    _email_executor.shutdown(wait=True)
+    if _queued_email_connection is not None:
+        try:
+            _queued_email_connection.quit()
+        except smtplib.SMTPException:
+            _queued_email_connection.close()
+        _queued_email_connection = None
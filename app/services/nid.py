@@ -1,3 +1,12 @@
+import base64
+import os
+
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from ..core.config import config
 from ..core.security import (
     Encrypted,
     decrypt_data,
@@ -6,6 +15,18 @@ from ..core.security import (
     verify_encrypted_data,
 )
 
+# NID images are stored as version byte + 12 byte nonce + AES-GCM ciphertext.
+# The AES key is derived from NID_ENCRYPTION_KEY, so images written with the
+# older Fernet format stay readable with the same configuration
+_NID_IMAGE_VERSION = b"\x01"
+_NID_IMAGE_NONCE_SIZE = 12
+nid_image_fernet = Fernet(config.nid_encryption_key)
+nid_image_aead = AESGCM(
+    HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"nid-image").derive(
+        base64.urlsafe_b64decode(config.nid_encryption_key)
+    )
+)
+
 
 def encrypt_nid(plain_nid: str | int | bytes):
     return encrypt_data(plain_nid)
@@ -21,3 +42,37 @@ def verify_nid(plain_nid: str | int | bytes, encrypted_nid: Encrypted) -> bool:
 
 def generate_nid_hmac(plain_nid: str | int | bytes) -> bytes:
     return generate_hmac(str(plain_nid) if isinstance(plain_nid, int) else plain_nid)
+
+
+def encrypt_nid_image(image_data: bytes) -> bytes:
+    nonce = os.urandom(_NID_IMAGE_NONCE_SIZE)
+    return (
+        _NID_IMAGE_VERSION
+        + nonce
+        + nid_image_aead.encrypt(nonce, image_data, _NID_IMAGE_VERSION)
+    )
+
+
+def decrypt_nid_image(encrypted_image: bytes) -> bytes:
+    # Fernet tokens always begin with b"gAAAAA", never with the version byte
+    if not encrypted_image.startswith(_NID_IMAGE_VERSION):
+        return nid_image_fernet.decrypt(encrypted_image)
+
+    nonce_end = len(_NID_IMAGE_VERSION) + _NID_IMAGE_NONCE_SIZE
+    return nid_image_aead.decrypt(
+        encrypted_image[len(_NID_IMAGE_VERSION) : nonce_end],
+        encrypted_image[nonce_end:],
+        _NID_IMAGE_VERSION,
+    )
+
+
+def encrypt_plaintext_nid_images() -> None:
+    # NID images uploaded before encryption was introduced are stored as
+    # plain .webp files next to the encrypted ones
+    for plaintext_path in config.nid_dir.glob("*.webp"):
+        encrypted_path = plaintext_path.with_suffix(".encrypted")
+        if not encrypted_path.exists():
+            temporary_path = encrypted_path.with_suffix(".encrypted.tmp")
+            temporary_path.write_bytes(encrypt_nid_image(plaintext_path.read_bytes()))
+            os.replace(temporary_path, encrypted_path)
+        plaintext_path.unlink()
@@ -0,0 +1,32 @@
+import base64
+import hmac
+import os
+import time
+
+OTP_DIGITS = 6
+OTP_INTERVAL = 30  # seconds
+_OTP_MODULUS = 10**OTP_DIGITS
+
+
+def generate_otp_secret() -> str:
+    return base64.urlsafe_b64encode(os.urandom(20)).decode()
+
+
+def _hotp(key: bytes, counter: int) -> str:
+    digest = hmac.digest(key, counter.to_bytes(8, "big"), "sha1")
+    offset = digest[-1] & 0x0F
+    code = int.from_bytes(digest[offset : offset + 4], "big") & 0x7FFFFFFF
+    return f"{code % _OTP_MODULUS:0{OTP_DIGITS}d}"
+
+
+def totp_now(secret: str) -> str:
+    return _hotp(base64.urlsafe_b64decode(secret), int(time.time()) // OTP_INTERVAL)
+
+
+def verify_totp(secret: str, otp: str) -> bool:
+    # accept one step of drift on either side
+    key = base64.urlsafe_b64decode(secret)
+    counter = int(time.time()) // OTP_INTERVAL
+    return any(
+        hmac.compare_digest(_hotp(key, counter + drift), otp) for drift in (0, -1, 1)
+    )
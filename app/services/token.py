@@ -2,10 +2,22 @@ from datetime import timedelta
 from typing import Any
 
 import jwt
+from sqlmodel import Session, delete
 
 from ..core.config import config
+from ..database.models.token import RefreshToken
 from ..utils.time import get_utc_time
 
+# parse the configured keys once instead of on every encode/decode
+_jwt_algorithm = jwt.get_algorithm_by_name(config.jwt_algorithm)
+_jwt_signing_key = _jwt_algorithm.prepare_key(config.jwt_private_key)
+_jwt_verifying_key = _jwt_algorithm.prepare_key(config.jwt_public_key)
+_jwt_algorithms = [config.jwt_algorithm]
+_jwt_decode_options: dict[bool, dict[str, Any]] = {
+    True: {"verify_exp": True},
+    False: {"verify_exp": False},
+}
+
 
 def encode_token(
     data: dict[str, Any],
@@ -22,15 +34,25 @@ def encode_token(
         "exp": int(exp.timestamp()),
     }
     return jwt.encode(
-        payload=payload, key=config.jwt_private_key, algorithm=config.jwt_algorithm
+        payload=payload, key=_jwt_signing_key, algorithm=config.jwt_algorithm
     )
 
 
 def decode_token(token: str, verify_exp: bool = True) -> dict[str, Any]:
     return jwt.decode(
         jwt=token,
-        key=config.jwt_public_key,
-        algorithms=[config.jwt_algorithm],
+        key=_jwt_verifying_key,
+        algorithms=_jwt_algorithms,
         leeway=30,
-        options={"verify_exp": verify_exp},
+        options=_jwt_decode_options[verify_exp],
+    )
+
+
+def purge_expired_refresh_tokens(
+    db: Session, grace_period: timedelta = timedelta(days=7)
+) -> None:
+    expired = delete(RefreshToken).where(
+        RefreshToken.expires_at < get_utc_time() - grace_period
     )
+    db.exec(expired)  # type: ignore
+    db.commit()
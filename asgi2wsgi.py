@@ -1,13 +1,21 @@
 # source - https://github.com/RakibulHasanRatul/asgi2wsgi
 
 import asyncio
+import atexit
 import concurrent.futures
 import logging
 import queue
 import sys
 import threading
 from http import HTTPStatus
-from typing import Any, Awaitable, Callable, Iterable, MutableMapping
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    MutableMapping,
+)
 
 # Configure the root logger for basic internal error logging.
 # By default, critical issues are logged to stderr.
@@ -29,12 +37,16 @@ ENCODING = "latin-1"
 # This limit prevents excessive memory consumption from very large uploads,
 # especially when the underlying WSGI server might buffer the entire body.
 MAX_BODY_SIZE = 10 * 1024 * 1024
+# Block size used when a file sent via `http.response.pathsend` is streamed back
+# to the WSGI server, either through `wsgi.file_wrapper` or plain reads.
+FILE_BLOCK_SIZE = 64 * 1024
 
 # Type aliases for improved type safety and readability throughout the adapter.
 type StartResponse = Callable[[str, list[tuple[str, str]]], None]
 type WSGIEnviron = dict[str, Any]
 type StartQueue = queue.SimpleQueue[tuple[str, list[tuple[str, str]]]]
-type ChunkQueue = queue.SimpleQueue[bytes | None]
+# A `str` item is a file path from an `http.response.pathsend` message.
+type ChunkQueue = queue.SimpleQueue[bytes | str | None]
 type Scope = MutableMapping[str, Any]
 type Message = MutableMapping[str, Any]
 type Send = Callable[[Message], Awaitable[None]]
@@ -42,6 +54,13 @@ type Receive = Callable[[], Awaitable[Message]]
 type ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
 
 
+def _read_file_blocks(path: str) -> Iterator[bytes]:
+    """Yields the file at `path` in `FILE_BLOCK_SIZE` blocks."""
+    with open(path, "rb") as file:
+        while block := file.read(FILE_BLOCK_SIZE):
+            yield block
+
+
 class ASGI2WSGI:
     """
     ASGI2WSGI is a robust adapter designed to enable ASGI (Asynchronous Server Gateway Interface)
@@ -63,6 +82,11 @@ class ASGI2WSGI:
       syntax for clarity and maintainability.
     - Easy Integration: Provides a straightforward way to deploy ASGI applications
       within existing WSGI server setups.
+    - Lifespan Support: Runs the application's startup handlers before serving and its
+      shutdown handlers at interpreter exit, on a dedicated long-lived event loop.
+    - Path Send Support: Advertises the `http.response.pathsend` extension and hands the
+      file to the server's `wsgi.file_wrapper`, so it can use `sendfile()` instead of
+      copying the body through Python.
 
     Usage Example:
     ```python
@@ -112,6 +136,7 @@ class ASGI2WSGI:
         num_workers: int = 1,
         log_format: str = "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
         log_stream: Any = sys.stderr,
+        lifespan: bool = True,
     ) -> None:
         """
         Initializes the ASGI2WSGI adapter with the target ASGI application.
@@ -126,6 +151,10 @@ class ASGI2WSGI:
             log_format: String to configure the log format for the adapter's internal logger.
                         Example: "%(asctime)s - %(levelname)s - %(name)s - %(message)s".
             log_stream: The stream to which log messages will be written. Defaults to sys.stderr.
+            lifespan: Whether to drive the ASGI lifespan protocol. When enabled, the
+                      application's startup handlers run before the adapter accepts
+                      requests and its shutdown handlers run at interpreter exit.
+                      Defaults to True.
         """
         self.app = app
         # Initialize ThreadPoolExecutor. This executor will typically persist for the
@@ -147,10 +176,131 @@ class ASGI2WSGI:
         logger.debug("Logger format set to: %s", log_format)
         logger.debug("Logger stream set to: %s", log_stream)
 
+        # State shared between the lifespan scope and every request scope.
+        self.lifespan_state: dict[str, Any] = {}
+        self._lifespan_loop: asyncio.AbstractEventLoop | None = None
+        self._lifespan_receive_queue: asyncio.Queue[Message] | None = None
+        self._lifespan_startup_done = threading.Event()
+        self._lifespan_shutdown_done = threading.Event()
+        self._lifespan_error: str | None = None
+        if lifespan:
+            self._start_lifespan()
+
         logger.info(
             "ASGI2WSGI adapter initialized with %d worker threads.", num_workers
         )
 
+    def _start_lifespan(self) -> None:
+        """
+        Runs the ASGI lifespan protocol on a dedicated daemon thread.
+
+        Request threads create and close a fresh event loop per request, so the
+        lifespan coroutine gets its own long-lived loop instead. This method blocks
+        until the application reports startup completion (or failure), and registers
+        `shutdown` to run at interpreter exit.
+
+        Raises:
+            RuntimeError: If the application reports `lifespan.startup.failed`.
+        """
+        thread = threading.Thread(
+            target=self._run_lifespan_in_thread,
+            name="asgi2wsgi-lifespan",
+            daemon=True,
+        )
+        thread.start()
+        self._lifespan_startup_done.wait()
+        if self._lifespan_error is not None:
+            raise RuntimeError(f"ASGI lifespan startup failed: {self._lifespan_error}")
+        atexit.register(self.shutdown)
+
+    def _run_lifespan_in_thread(self) -> None:
+        """
+        Entry point of the lifespan thread: owns the lifespan event loop until the
+        application's lifespan coroutine returns.
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._lifespan_loop = loop
+        try:
+            loop.run_until_complete(self._lifespan())
+        finally:
+            # Unblock any waiter, whatever state the lifespan coroutine ended in.
+            self._lifespan_startup_done.set()
+            self._lifespan_shutdown_done.set()
+            loop.close()
+            logger.debug("Lifespan event loop closed.")
+
+    async def _lifespan(self) -> None:
+        """
+        Sends `lifespan.startup`, then waits for `shutdown` to enqueue
+        `lifespan.shutdown`, translating the application's replies into the
+        thread events the WSGI side waits on.
+        """
+        receive_queue: asyncio.Queue[Message] = asyncio.Queue()
+        self._lifespan_receive_queue = receive_queue
+        receive_queue.put_nowait({"type": "lifespan.startup"})
+
+        async def receive() -> Message:
+            return await receive_queue.get()
+
+        async def send(message: Message) -> None:
+            message_type: Any = message.get("type")
+            logger.debug("ASGI lifespan send message of type '%s'.", message_type)
+            if message_type == "lifespan.startup.complete":
+                self._lifespan_startup_done.set()
+            elif message_type == "lifespan.startup.failed":
+                self._lifespan_error = message.get("message", "")
+                self._lifespan_startup_done.set()
+            elif message_type == "lifespan.shutdown.complete":
+                self._lifespan_shutdown_done.set()
+            elif message_type == "lifespan.shutdown.failed":
+                logger.error(
+                    "ASGI lifespan shutdown failed: %s", message.get("message", "")
+                )
+                self._lifespan_shutdown_done.set()
+
+        scope: Scope = {
+            "type": "lifespan",
+            "asgi": {"version": "3.0", "spec_version": "2.0"},
+            "state": self.lifespan_state,
+        }
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            if self._lifespan_startup_done.is_set():
+                logger.exception("Exception caught in ASGI lifespan handler:")
+            else:
+                # Per the ASGI spec, an app raising here does not support lifespan.
+                logger.info("ASGI application does not support lifespan; skipping.")
+
+    def shutdown(self, timeout: float | None = 30.0) -> None:
+        """
+        Runs the application's lifespan shutdown handlers and stops the worker pool.
+        Registered with `atexit` when lifespan is enabled; safe to call more than once.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the shutdown handlers.
+        """
+        loop = self._lifespan_loop
+        receive_queue = self._lifespan_receive_queue
+        if (
+            loop is not None
+            and receive_queue is not None
+            and not self._lifespan_shutdown_done.is_set()
+            and not loop.is_closed()
+        ):
+            try:
+                loop.call_soon_threadsafe(
+                    receive_queue.put_nowait, {"type": "lifespan.shutdown"}
+                )
+            except RuntimeError:
+                # The loop closed between the check and the call.
+                pass
+            else:
+                if not self._lifespan_shutdown_done.wait(timeout):
+                    logger.warning("ASGI lifespan shutdown timed out.")
+        self.executor.shutdown(wait=True)
+
     def __call__(
         self,
         environ: WSGIEnviron,
@@ -224,7 +374,9 @@ class ASGI2WSGI:
             "server": (environ.get("SERVER_NAME", "localhost"), server_port),
             "client": (environ.get("REMOTE_ADDR", "127.0.0.1"), remote_port),
             "scheme": environ.get("wsgi.url_scheme", "http"),
-            "extensions": {},  # ASGI extensions can be added here if supported by the adapter
+            "extensions": {"http.response.pathsend": {}},
+            # Each request gets a shallow copy of the state populated during lifespan startup.
+            "state": self.lifespan_state.copy(),
         }
         logger.debug(
             "Constructed ASGI scope: %s",
@@ -306,26 +458,27 @@ class ASGI2WSGI:
         status, wsgi_headers = start_queue.get()
         logger.debug("Received HTTP status '%s' and headers from ASGI thread.", status)
 
-        def response_stream() -> Iterable[bytes]:
+        def response_stream(chunk: bytes | str | None) -> Iterable[bytes]:
             """
             Generator function that yields response body chunks from the chunk_queue.
             The WSGI server iterates over this generator to stream the response back to the client.
             It continuously fetches chunks from `chunk_queue` until a `None` sentinel
             is received, indicating the end of the response body stream.
+            `chunk` is the first item, already taken off the queue by the caller.
             """
-            while True:
-                chunk: bytes | None = chunk_queue.get()
-                if chunk is None:  # Sentinel value indicating end of stream
+            while chunk is not None:  # None is the end-of-stream sentinel
+                if isinstance(chunk, str):
+                    # A pathsend message following body chunks; stream the file inline.
+                    yield from _read_file_blocks(chunk)
+                else:
                     logger.debug(
-                        "Received end-of-stream sentinel for %s.", scope["path"]
+                        "Yielding %d bytes of response body for %s.",
+                        len(chunk),
+                        scope["path"],
                     )
-                    break
-                logger.debug(
-                    "Yielding %d bytes of response body for %s.",
-                    len(chunk),
-                    scope["path"],
-                )
-                yield chunk
+                    yield chunk
+                chunk = chunk_queue.get()
+            logger.debug("Received end-of-stream sentinel for %s.", scope["path"])
 
         # Call the WSGI `start_response` callable with the received status and headers.
         start_response(status, wsgi_headers)
@@ -335,9 +488,28 @@ class ASGI2WSGI:
             status,
         )
 
+        # The ASGI application has already finished, so a pathsend message is
+        # either the only body item or absent. Hand the file straight to the
+        # server so it can use sendfile() instead of iterating in Python.
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        first_chunk: bytes | str | None = chunk_queue.get()
+        if isinstance(first_chunk, str):
+            logger.debug(
+                "Sending file %s for %s via %s.",
+                first_chunk,
+                scope["path"],
+                "wsgi.file_wrapper" if file_wrapper else "block reads",
+            )
+            if file_wrapper is not None:
+                # Not a `with` block: the file must outlive this call. The server
+                # owns the returned wrapper and its close() closes the file.
+                file = open(first_chunk, "rb")  # noqa: SIM115
+                return file_wrapper(file, FILE_BLOCK_SIZE)
+            return _read_file_blocks(first_chunk)
+
         # Return the generator. The WSGI server will iterate over this to
         # send the response body chunks to the client as they become available.
-        return response_stream()
+        return response_stream(first_chunk)
 
     def _run_asgi_in_thread(
         self,
@@ -393,8 +565,8 @@ class ASGI2WSGI:
 
             This asynchronous function processes messages from the ASGI application
             and puts them into the appropriate queues for the WSGI thread.
-            It handles `http.response.start` for headers and `http.response.body`
-            for response content.
+            It handles `http.response.start` for headers, `http.response.body`
+            for response content and `http.response.pathsend` for file bodies.
             """
             message_type: Any = message.get("type")
             logger.debug(
@@ -453,6 +625,16 @@ class ASGI2WSGI:
                 if not message.get("more_body", False):
                     chunk_queue.put(None)  # Sentinel for end of stream
                     logger.debug("Queued end-of-stream sentinel for %s.", scope["path"])
+            elif message_type == "http.response.pathsend":
+                # The whole body is the file at 'path'; the WSGI side opens it so
+                # the server can send it without copying through this thread.
+                chunk_queue.put(message["path"])
+                chunk_queue.put(None)
+                logger.debug(
+                    "Queued path %s as response body for %s.",
+                    message["path"],
+                    scope["path"],
+                )
             else:
                 logger.warning(
                     "Received unhandled ASGI message type '%s' for %s.",
@@ -0,0 +1,58 @@
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.database.models.account import Account, AccountStatus
+from app.services import auth
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'accounts.sqlite'}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def account(engine):
+    account = Account(
+        phone_number="01700000000",
+        email_address="cached@example.com",
+        password_hash="hash",
+    )
+    with Session(engine, expire_on_commit=False) as session:
+        session.add(account)
+        session.commit()
+    yield account
+    auth.invalidate_cached_account(account.uuid)
+
+
+def test_status_change_evicts_cached_account(engine, account):
+    with Session(engine) as session:
+        assert auth._get_active_account(session, account.uuid) is not None
+    assert account.uuid in auth._account_cache
+
+    with Session(engine) as session:
+        stored = session.get(Account, account.uuid)
+        stored.status = AccountStatus.banned
+        session.commit()
+
+    with Session(engine) as session:
+        assert auth._get_active_account(session, account.uuid) is None
+
+
+def test_read_between_flush_and_commit_is_evicted(engine, account):
+    with Session(engine) as writer:
+        stored = writer.get(Account, account.uuid)
+        stored.status = AccountStatus.disabled
+        writer.flush()
+
+        # a concurrent request still sees the committed, active row and caches it
+        with Session(engine) as reader:
+            assert auth._get_active_account(reader, account.uuid) is not None
+        assert account.uuid in auth._account_cache
+
+        writer.commit()
+
+    with Session(engine) as session:
+        assert auth._get_active_account(session, account.uuid) is None
@@ -0,0 +1,74 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+
+from app import app
+from app.api.incoming_record import routes
+from app.database.models.payment import (
+    IncomingRecord,
+    IncomingRecordSource,
+    PaymentRecord,
+    PaymentType,
+)
+from app.services.auth import get_current_admin
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'incoming.sqlite'}")
+    monkeypatch.setattr(routes, "emr_engine", engine)
+    app.dependency_overrides[get_current_admin] = lambda: None
+    yield engine
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+def _add_incoming_records(engine, count: int) -> list[int]:
+    SQLModel.metadata.create_all(engine)
+    payment_ids = []
+    with Session(engine) as db:
+        for i in range(count):
+            payment_record = PaymentRecord(
+                amount=100 + i,
+                transaction_id=f"tx{i}",
+                payment_type=PaymentType.incoming,
+            )
+            db.add(payment_record)
+            db.add(
+                IncomingRecord(
+                    payment_id=payment_record.payment_id,
+                    details="details",
+                    source=IncomingRecordSource.donation,
+                    paid_by="payer",
+                )
+            )
+            payment_ids.append(payment_record.payment_id)
+        db.commit()
+    return payment_ids
+
+
+@pytest.mark.parametrize("count", [5, 4, 0])
+def test_cursor_round_trip_lists_every_record_once(engine, count):
+    payment_ids = _add_incoming_records(engine, count)
+    client = TestClient(app)
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/incoming-record/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen += [record["payment_id"] for record in page["data"]]
+        if page["next_cursor"] is None:
+            break
+        assert page["next_cursor"] == page["data"][-1]["payment_id"]
+        params["cursor"] = page["next_cursor"]
+
+    assert seen == sorted(payment_ids, reverse=True)
+
+
+def test_failing_query_is_a_server_error(engine):
+    # no tables were created, so the list query fails before any body is sent
+    client = TestClient(app, raise_server_exceptions=False)
+    response = client.get("/incoming-record/")
+    assert response.status_code == 500